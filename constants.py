@@ -106,3 +106,9 @@ UNKNOWN_VALUE = "Unknown"
 
 # Target player for team analysis
 TARGET_PLAYER = "Aezurly"
+
+# Column names shared by the multi-game tables and their display helpers
+WIN_RATE_COL = 'Win Rate'
+CS_MIN_COL = 'CS/min'
+VISION_MIN_COL = 'Vision/min'
+DMG_MIN_COL = 'Dmg/min'
@@ -1,22 +1,30 @@
 # MODEL: Game data representation and business logic for game statistics
 import json
+from pathlib import Path
 from typing import List, Optional
 from models.participant_data import ParticipantData
 from constants import UNKNOWN_VALUE
 
+# orjson is an optional, faster drop-in for the JSON parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class GameData:
     """Class to manage game data."""
     def __init__(self, file_path: str):
         self.file_path = file_path
     
         self.data = self._load_data()
-        self.participants = self._load_participants()
+        # Built on first access; aggregation reads the raw participants instead
+        self._participants: Optional[List[ParticipantData]] = None
 
     def _load_data(self) -> Optional[dict]:
         """Load JSON data from file."""
         try:
-            with open(self.file_path, 'r') as file:
-                return json.load(file)
+            return _json_loads(Path(self.file_path).read_bytes())
         except FileNotFoundError:
             # Model should not print directly - let the controller handle display
             return None
@@ -24,10 +32,21 @@ class GameData:
             # Model should not print directly - let the controller handle display
             return None
 
+    @property
+    def participants(self) -> List[ParticipantData]:
+        """Participants wrapped in ParticipantData."""
+        if self._participants is None:
+            self._participants = self._load_participants()
+        return self._participants
+
     def _load_participants(self) -> List[ParticipantData]:
         """Load participant data."""
+        return [ParticipantData(p) for p in self.get_raw_participants()]
+
+    def get_raw_participants(self) -> List[dict]:
+        """Get the participants as raw JSON dictionaries."""
         if self.data and "participants" in self.data:
-            return [ParticipantData(p) for p in self.data["participants"]]
+            return self.data["participants"]
         return []
 
     def get_participant(self, index: int) -> Optional[ParticipantData]:
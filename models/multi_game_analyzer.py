@@ -1,16 +1,65 @@
 # MODEL: Multi-game analysis logic and player statistics calculation
 import os
 import json
-from typing import Dict, List, Optional
-from collections import defaultdict
+import multiprocessing
+from typing import Dict, List, Optional, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import pandas as pd
 from models.game_data import GameData
 from models.participant_data import ParticipantData
-from constants import DATA_DIR, TEAM_1_ID, TEAM_2_ID, UNKNOWN_VALUE
-from utils.utils import fix_encoding, normalize_player_name
+from constants import (
+    DATA_DIR, TEAM_1_ID, TEAM_2_ID, UNKNOWN_VALUE, WIN_RATE_COL, CS_MIN_COL, VISION_MIN_COL, DMG_MIN_COL
+)
+from utils.utils import fix_encoding, normalize_player_name, get_position_display_name
+from utils.predicates import MetricFormatter, compose_and, has_minimum_games, is_position
 import unicodedata
+from functools import lru_cache
+
+# Per-participant numeric columns, summed per player after loading
+TOTAL_FIELDS = ('wins', 'damage', 'kills', 'deaths', 'assists', 'cs', 'vision_score', 'gold_spent', 'game_duration')
+# Columns also summed per (player, champion)
+CHAMPION_FIELDS = ('wins', 'kills', 'deaths', 'assists')
+# Above this many files, parsing is spread across processes instead of threads
+PROCESS_POOL_THRESHOLD = 64
+
+# Common accented Latin letters, mapped to the same result as the NFD decomposition
+_ACCENT_TABLE = str.maketrans(
+    'àáâãäåçèéêëìíîïñòóôõöùúûüýÿÀÁÂÃÄÅÇÈÉÊËÌÍÎÏÑÒÓÔÕÖÙÚÛÜÝ',
+    'aaaaaaceeeeiiiinooooouuuuyyAAAAAACEEEEIIIINOOOOOUUUUY'
+)
+
+@lru_cache(maxsize=1024)
+def strip_accents(s: str) -> str:
+    """Remove accents from a string (decomposed combining marks are dropped)"""
+    if s.isascii():
+        return s
+    stripped = s.translate(_ACCENT_TABLE)
+    if stripped.isascii():
+        return stripped
+    # Characters outside the table still go through unicodedata
+    return ''.join(c for c in unicodedata.normalize('NFD', stripped) if unicodedata.category(c) != 'Mn')
+
+def _extract_participant_rows(game: GameData) -> List[tuple]:
+    """Flatten a game into (name, champion, position, *TOTAL_FIELDS) rows, one per participant"""
+    game_duration = game.get_game_duration()
+    return [ParticipantData.stat_row(data) + (game_duration,) for data in game.get_raw_participants()]
+
+def _parse_file(file_path: str) -> Optional[List[tuple]]:
+    """Parse a game file into participant rows (runs in worker processes, so the payload stays small)"""
+    game = GameData(file_path)
+    return _extract_participant_rows(game) if game.data else None
 
 class PlayerStats:
     """Class to accumulate and calculate average stats for a player"""
+    __slots__ = (
+        "name", "games_played", "total_wins", "total_damage", "total_kills", "total_deaths", "total_assists",
+        "total_cs", "total_vision_score", "total_gold_spent", "total_game_duration",
+        "champions_played", "positions_played", "champion_stats",
+        "avg_damage", "avg_kda", "avg_cs_per_minute", "avg_vision_score_per_minute", "avg_damage_per_minute",
+        "avg_damage_per_gold", "win_rate", "main_champion", "main_position"
+    )
     
     def __init__(self, name: str):
         self.name = normalize_player_name(name)  # Normalize player name for consistent handling
@@ -24,84 +73,87 @@ class PlayerStats:
         self.total_vision_score = 0
         self.total_gold_spent = 0
         self.total_game_duration = 0
-        self.champions_played = defaultdict(int)
-        self.positions_played = defaultdict(int)
+        self.champions_played = Counter()
+        self.positions_played = Counter()
         # Champion-specific stats for detailed analysis
         self.champion_stats = defaultdict(lambda: {
             'games': 0, 'wins': 0, 'kills': 0, 'deaths': 0, 'assists': 0
         })
+        self.finalize()
     
-    def add_game_stats(self, participant: ParticipantData, game_duration: int):
-        """Add stats from a single game"""
-        self.games_played += 1
-        champion = participant.get_champion()
-        is_win = participant.get_win()
-        
-        if is_win:
-            self.total_wins += 1
-        self.total_damage += participant.get_total_damage()
-        self.total_kills += participant.get_kills()
-        self.total_deaths += participant.get_deaths()
-        self.total_assists += participant.get_assists()
-        self.total_cs += participant.get_cs()
-        self.total_vision_score += participant.get_vision_score()
-        self.total_gold_spent += participant.get_gold_spent()
-        self.total_game_duration += game_duration
-        self.champions_played[champion] += 1
-        self.positions_played[participant.get_position()] += 1
-        
-        # Track champion-specific stats
-        self.champion_stats[champion]['games'] += 1
-        if is_win:
-            self.champion_stats[champion]['wins'] += 1
-        self.champion_stats[champion]['kills'] += participant.get_kills()
-        self.champion_stats[champion]['deaths'] += participant.get_deaths()
-        self.champion_stats[champion]['assists'] += participant.get_assists()
+    def set_totals(self, games_played: int, totals: Dict[str, int]):
+        """Set the accumulated totals from the aggregated game columns"""
+        self.games_played = games_played
+        self.total_wins = totals['wins']
+        self.total_damage = totals['damage']
+        self.total_kills = totals['kills']
+        self.total_deaths = totals['deaths']
+        self.total_assists = totals['assists']
+        self.total_cs = totals['cs']
+        self.total_vision_score = totals['vision_score']
+        self.total_gold_spent = totals['gold_spent']
+        self.total_game_duration = totals['game_duration']
+    
+    def set_champion_totals(self, champion: str, games: int, totals: Dict[str, int]):
+        """Set the accumulated stats of a specific champion"""
+        self.champion_stats[champion] = {'games': games, **totals}
+    
+    def finalize(self):
+        """Compute the averages once totals are complete (stats are read-only afterwards)"""
+        games = self.games_played
+        self.avg_damage = self.total_damage / games if games > 0 else 0
+        
+        avg_deaths = self.total_deaths / games if games > 0 else 0
+        avg_kills = self.total_kills / games if games > 0 else 0
+        avg_assists = self.total_assists / games if games > 0 else 0
+        self.avg_kda = (avg_kills + avg_assists) / avg_deaths if avg_deaths > 0 else avg_kills + avg_assists
+        
+        total_minutes = self.total_game_duration / 60 if self.total_game_duration > 0 else 0
+        self.avg_cs_per_minute = self.total_cs / total_minutes if total_minutes > 0 else 0
+        self.avg_vision_score_per_minute = self.total_vision_score / total_minutes if total_minutes > 0 else 0
+        self.avg_damage_per_minute = self.total_damage / total_minutes if total_minutes > 0 else 0
+        self.avg_damage_per_gold = self.total_damage / self.total_gold_spent if self.total_gold_spent > 0 else 0
+        self.win_rate = (self.total_wins / games) if games > 0 else 0.0
+        
+        self.main_champion = self.champions_played.most_common(1)[0][0] if self.champions_played else UNKNOWN_VALUE
+        position = self.positions_played.most_common(1)[0][0] if self.positions_played else UNKNOWN_VALUE
+        self.main_position = get_position_display_name(position, short=True)
     
     def get_average_damage(self) -> float:
         """Get average damage per game"""
-        return self.total_damage / self.games_played if self.games_played > 0 else 0
+        return self.avg_damage
     
     def get_average_kda(self) -> float:
         """Get average KDA"""
-        avg_deaths = self.total_deaths / self.games_played if self.games_played > 0 else 0
-        avg_kills = self.total_kills / self.games_played if self.games_played > 0 else 0
-        avg_assists = self.total_assists / self.games_played if self.games_played > 0 else 0
-        return (avg_kills + avg_assists) / avg_deaths if avg_deaths > 0 else avg_kills + avg_assists
+        return self.avg_kda
     
     def get_average_cs_per_minute(self) -> float:
         """Get average CS per minute"""
-        total_minutes = self.total_game_duration / 60 if self.total_game_duration > 0 else 0
-        return self.total_cs / total_minutes if total_minutes > 0 else 0
+        return self.avg_cs_per_minute
     
     def get_average_vision_score_per_minute(self) -> float:
         """Get average vision score per minute"""
-        total_minutes = self.total_game_duration / 60 if self.total_game_duration > 0 else 0
-        return self.total_vision_score / total_minutes if total_minutes > 0 else 0
+        return self.avg_vision_score_per_minute
     
     def get_average_damage_per_minute(self) -> float:
         """Get average damage per minute"""
-        total_minutes = self.total_game_duration / 60 if self.total_game_duration > 0 else 0
-        return self.total_damage / total_minutes if total_minutes > 0 else 0
+        return self.avg_damage_per_minute
     
     def get_average_damage_per_gold(self) -> float:
         """Get average damage per gold spent"""
-        return self.total_damage / self.total_gold_spent if self.total_gold_spent > 0 else 0
+        return self.avg_damage_per_gold
     
     def get_most_played_champion(self) -> str:
         """Get most played champion"""
-        return max(self.champions_played.items(), key=lambda x: x[1])[0] if self.champions_played else UNKNOWN_VALUE
+        return self.main_champion
     
     def get_most_played_position(self) -> str:
         """Get most played position"""
-        from utils.utils import get_position_display_name
-        
-        position = max(self.positions_played.items(), key=lambda x: x[1])[0] if self.positions_played else UNKNOWN_VALUE
-        return get_position_display_name(position, short=True)
+        return self.main_position
     
     def get_win_rate(self) -> float:
         """Get win rate based on games played"""
-        return (self.total_wins / self.games_played) if self.games_played > 0 else 0.0
+        return self.win_rate
     
     def get_champion_win_rate(self, champion: str) -> float:
         """Get win rate for a specific champion"""
@@ -122,47 +174,143 @@ class MultiGameAnalyzer:
     """Class to analyze multiple games and calculate player averages"""
     
     # Constants for column names to avoid duplication
-    WIN_RATE_COL = 'Win Rate'
-    CS_MIN_COL = 'CS/min'
-    VISION_MIN_COL = 'Vision/min'
-    DMG_MIN_COL = 'Dmg/min'
+    WIN_RATE_COL = WIN_RATE_COL
+    CS_MIN_COL = CS_MIN_COL
+    VISION_MIN_COL = VISION_MIN_COL
+    DMG_MIN_COL = DMG_MIN_COL
     
     def __init__(self, data_directory: str = DATA_DIR):
         self.data_directory = data_directory
         self.player_stats: Dict[str, PlayerStats] = {}
         self.games_analyzed = 0
+        # Structure of arrays: one entry per participant, aggregated once all games are read
+        self._player_index: Dict[str, int] = {}
+        self._champion_index: Dict[Tuple[int, str], int] = {}
+        self._player_ids: List[int] = []
+        self._champion_ids: List[int] = []
+        self._champion_lists: List[List[str]] = []
+        self._position_lists: List[List[str]] = []
+        self._columns: Dict[str, List[int]] = {field: [] for field in TOTAL_FIELDS}
+        self._sorted_player_names: Optional[List[str]] = None
+        self._normalized_index: Optional[Dict[str, str]] = None
+        # One row per player, indexed by name, rebuilt after loading
+        self._build_summary_frame()
+    
     def load_all_games(self):
         """Load and analyze all games in the data directory"""
         if not os.path.exists(self.data_directory):
             raise FileNotFoundError(f"Data directory '{self.data_directory}' not found.")
         
-        json_files = [f for f in os.listdir(self.data_directory) if f.endswith('.json')]
+        with os.scandir(self.data_directory) as entries:
+            json_files = [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
         
         if not json_files:
             raise FileNotFoundError(f"No JSON files found in '{self.data_directory}' directory.")
         
-        for filename in json_files:
-            file_path = os.path.join(self.data_directory, filename)
-            try:
-                game = GameData(file_path)
-                if game.data:
-                    self._analyze_game(game)
-            except Exception as e:
-                # Log error but continue processing other files
-                print(f"Error analyzing {filename}: {e}")
+        # JSON parsing is CPU bound, so large directories use every core
+        if len(json_files) >= PROCESS_POOL_THRESHOLD:
+            # Spawned workers, since forking the threaded Streamlit server can deadlock
+            executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2))
+        
+        errors = []
+        with executor:
+            futures = [(entry.name, executor.submit(_parse_file, entry.path)) for entry in json_files]
+            # Games are merged on this process in file order, so player stats need no lock
+            for filename, future in futures:
+                try:
+                    rows = future.result()
+                    if rows is not None:
+                        self._add_game_rows(rows)
+                except Exception as e:
+                    # Log error but continue processing other files
+                    errors.append(f"Error analyzing {filename}: {e}")
+        
+        # Report all failures in a single write
+        if errors:
+            print("\n".join(errors))
+        
+        self._aggregate_columns()
+        self._build_summary_frame()
+        self._sorted_player_names = None
+        self._normalized_index = None
     
-    def _analyze_game(self, game: GameData):
-        """Analyze a single game and update player stats"""
+    def _add_game_rows(self, rows: List[tuple]):
+        """Append the participant rows of one game to the stat columns"""
         self.games_analyzed += 1
-        game_duration = game.get_game_duration()
+        columns = [self._columns[field] for field in TOTAL_FIELDS]
         
-        for participant in game.get_all_participants():
-            player_name = normalize_player_name(participant.get_name())
-            
-            if player_name not in self.player_stats:
+        for player_name, champion, position, *values in rows:
+            # get_name already applies the encoding fix, so keys match PlayerStats.name
+            player_id = self._player_index.get(player_name)
+            if player_id is None:
+                player_id = self._player_index[player_name] = len(self._player_index)
                 self.player_stats[player_name] = PlayerStats(player_name)
+                self._champion_lists.append([])
+                self._position_lists.append([])
             
-            self.player_stats[player_name].add_game_stats(participant, game_duration)
+            self._champion_lists[player_id].append(champion)
+            self._position_lists[player_id].append(position)
+            
+            self._player_ids.append(player_id)
+            self._champion_ids.append(self._champion_index.setdefault((player_id, champion), len(self._champion_index)))
+            for column, value in zip(columns, values):
+                column.append(value)
+    
+    @staticmethod
+    def _sum_by_group(group_ids: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+        """Sum the rows of an integer (participants, fields) matrix per group id"""
+        sums = np.zeros((n_groups, values.shape[1]), dtype=np.int64)
+        np.add.at(sums, group_ids, values)
+        return sums
+    
+    def _aggregate_columns(self):
+        """Sum the participant columns per player and per champion"""
+        if not self._player_ids:
+            return
+        
+        # One int64 matrix with a leading games column, reduced in a single pass per grouping
+        values = np.column_stack(
+            [np.ones(len(self._player_ids), dtype=np.int64)]
+            + [np.asarray(self._columns[field], dtype=np.int64) for field in TOTAL_FIELDS]
+        )
+        
+        player_sums = self._sum_by_group(
+            np.asarray(self._player_ids, dtype=np.int64), values, len(self._player_index)
+        ).tolist()
+        for player_name, player_id in self._player_index.items():
+            games, *totals = player_sums[player_id]
+            stats = self.player_stats[player_name]
+            stats.set_totals(games, dict(zip(TOTAL_FIELDS, totals)))
+            stats.champions_played = Counter(self._champion_lists[player_id])
+            stats.positions_played = Counter(self._position_lists[player_id])
+        
+        champion_columns = [0] + [TOTAL_FIELDS.index(field) + 1 for field in CHAMPION_FIELDS]
+        champion_sums = self._sum_by_group(
+            np.asarray(self._champion_ids, dtype=np.int64), values[:, champion_columns], len(self._champion_index)
+        ).tolist()
+        player_names = list(self._player_index)
+        for (player_id, champion), champion_id in self._champion_index.items():
+            games, *totals = champion_sums[champion_id]
+            self.player_stats[player_names[player_id]].set_champion_totals(
+                champion, games, dict(zip(CHAMPION_FIELDS, totals))
+            )
+        
+        for stats in self.player_stats.values():
+            stats.finalize()
+    
+    def _build_summary_frame(self):
+        """Build the per-player DataFrame used by the ranking queries"""
+        self.df = pd.DataFrame(
+            {
+                'games': [stats.games_played for stats in self.player_stats.values()],
+                'avg_damage': [stats.avg_damage for stats in self.player_stats.values()],
+                'avg_kda': [stats.avg_kda for stats in self.player_stats.values()],
+            },
+            index=list(self.player_stats),
+            dtype=float
+        )
     
     def get_player_stats(self, player_name: str) -> Optional[PlayerStats]:
         """Get stats for a specific player"""
@@ -172,22 +320,22 @@ class MultiGameAnalyzer:
         """Get list of all player names"""
         return list(self.player_stats.keys())
     
+    @property
+    def sorted_player_names(self) -> List[str]:
+        """Alphabetically sorted player names, computed once per load"""
+        if self._sorted_player_names is None:
+            self._sorted_player_names = sorted(self.player_stats)
+        return self._sorted_player_names
+    
     def get_top_players_by_damage(self, limit: int = 10) -> List[tuple]:
         """Get top players by average damage"""
-        sorted_players = sorted(
-            self.player_stats.items(),
-            key=lambda x: x[1].get_average_damage(),
-            reverse=True
-        )
-        return [(name, stats.get_average_damage()) for name, stats in sorted_players[:limit]]
+        top_players = self.df.nlargest(limit, 'avg_damage')
+        return list(zip(top_players.index, top_players['avg_damage'].tolist()))
     
     def get_top_players_by_kda(self, limit: int = 10) -> List[tuple]:
         """Get top players by average KDA"""
-        sorted_players = sorted(
-            self.player_stats.items(),
-            key=lambda x: x[1].get_average_kda(),
-            reverse=True        )
-        return [(name, stats.get_average_kda()) for name, stats in sorted_players[:limit]]
+        top_players = self.df.nlargest(limit, 'avg_kda')
+        return list(zip(top_players.index, top_players['avg_kda'].tolist()))
     
     def find_player(self, player_name: str) -> Optional[str]:
         """Find a player by name, handling encoding and accent variations"""
@@ -198,21 +346,19 @@ class MultiGameAnalyzer:
         if fixed_name in self.player_stats:
             return fixed_name
         
-        def strip_accents(s):
-            return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
-
-        for name in self.player_stats:
-            if (strip_accents(name).lower() == strip_accents(player_name).lower() or 
-                strip_accents(name).lower() == strip_accents(fixed_name).lower()):
-                return name
-        return None
+        if self._normalized_index is None:
+            # Accent and case insensitive keys, first player wins on collisions
+            self._normalized_index = {}
+            for name in self.player_stats:
+                self._normalized_index.setdefault(strip_accents(name).lower(), name)
+        
+        return (self._normalized_index.get(strip_accents(player_name).lower())
+                or self._normalized_index.get(strip_accents(fixed_name).lower()))
 
     def get_players_by_position(self, position: str) -> List[PlayerStats]:
         """Get all players who play a specific position"""
-        return [
-            stats for stats in self.player_stats.values()
-            if stats.games_played > 0 and stats.get_most_played_position() == position
-        ]
+        plays_position = compose_and(has_minimum_games(1), is_position(position))
+        return [stats for stats in self.player_stats.values() if plays_position(stats)]
     
     def get_active_players(self) -> List[tuple]:
         """Get all players with at least one game played"""
@@ -381,8 +527,6 @@ class MultiGameAnalyzer:
 
     def create_position_comparison_data(self, player_name: str) -> list:
         """Create position comparison data for a player"""
-        from utils.predicates import MetricFormatter
-        
         player_stats = self.player_stats.get(player_name)
         if not player_stats:
             return []
@@ -435,6 +579,7 @@ class MultiGameAnalyzer:
         
         json_files = [f for f in os.listdir(self.data_directory) if f.endswith('.json')]
         games_data = []
+        errors = []
         
         for filename in json_files:
             file_path = os.path.join(self.data_directory, filename)
@@ -459,7 +604,7 @@ class MultiGameAnalyzer:
                     
                     for participant in participants:
                         player_info = {
-                            'name': normalize_player_name(participant.get_name()),
+                            'name': participant.get_name(),
                             'champion': participant.get_champion(),
                             'position': participant.get_position(),
                             'win': participant.get_win(),
@@ -484,9 +629,12 @@ class MultiGameAnalyzer:
                     games_data.append(game_info)
                     
             except Exception as e:
-                print(f"Error processing {filename}: {e}")
+                errors.append(f"Error processing {filename}: {e}")
                 continue
         
+        if errors:
+            print("\n".join(errors))
+        
         # Sort by filename (assuming date format in filename) - most recent first
         games_data.sort(key=lambda x: x['filename'], reverse=True)
         return games_data
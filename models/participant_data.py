@@ -1,22 +1,61 @@
 # MODEL: Participant data representation and business logic for player statistics
+import sys
 from constants import UNKNOWN_VALUE
 from utils.utils import normalize_player_name, normalize_position
 
+# Raw WIN field values meaning the participant won
+WIN_VALUES = frozenset(("Win", "1", 1, True))
+
+def get_raw_field(data: dict, field_name: str, alt_field_name: str = None) -> str:
+    """Get a raw participant field with fallback for different naming conventions."""
+    # Try main field name first (SCREAMING_SNAKE_CASE)
+    if field_name in data:
+        return data[field_name]
+    # Try alternative field name (camelCase)
+    if alt_field_name and alt_field_name in data:
+        return data[alt_field_name]
+    # Return default
+    return "0"
+
 class ParticipantData:
     """Class to manage participant data."""
+    __slots__ = ("data", "kills", "deaths", "assists", "total_damage", "cs", "vision_score", "gold_spent", "level")
+
     def __init__(self, data: dict):
         self.data = data
+        # Fields read for every participant of every game are cast once here
+        self.kills = int(self._get_field("CHAMPIONS_KILLED", "championsKilled"))
+        self.deaths = int(self._get_field("NUM_DEATHS", "numDeaths"))
+        self.assists = int(self._get_field("ASSISTS", "assists"))
+        self.total_damage = int(self._get_field("TOTAL_DAMAGE_DEALT_TO_CHAMPIONS", "totalDamageDealtToChampions"))
+        self.cs = (int(self._get_field("MINIONS_KILLED", "minionsKilled"))
+                   + int(self._get_field("NEUTRAL_MINIONS_KILLED", "neutralMinionsKilled")))
+        self.vision_score = int(self._get_field("VISION_SCORE", "visionScore"))
+        self.gold_spent = int(self._get_field("GOLD_SPENT", "goldSpent"))
+        self.level = int(self._get_field("LEVEL", "level"))
 
     def _get_field(self, field_name: str, alt_field_name: str = None) -> str:
         """Get field value with fallback for different naming conventions."""
-        # Try main field name first (SCREAMING_SNAKE_CASE)
-        if field_name in self.data:
-            return self.data[field_name]
-        # Try alternative field name (camelCase)
-        if alt_field_name and alt_field_name in self.data:
-            return self.data[alt_field_name]
-        # Return default
-        return "0"
+        return get_raw_field(self.data, field_name, alt_field_name)
+
+    @staticmethod
+    def stat_row(data: dict) -> tuple:
+        """Read (name, champion, position, win, damage, kills, deaths, assists, cs, vision score, gold spent)
+        straight from raw participant data, without building a ParticipantData."""
+        return (
+            normalize_player_name(get_raw_field(data, "RIOT_ID_GAME_NAME", "riotIdGameName") or UNKNOWN_VALUE),
+            sys.intern(get_raw_field(data, "SKIN", "skin") or UNKNOWN_VALUE),
+            normalize_position(get_raw_field(data, "INDIVIDUAL_POSITION", "individualPosition") or UNKNOWN_VALUE),
+            get_raw_field(data, "WIN", "win") in WIN_VALUES,
+            int(get_raw_field(data, "TOTAL_DAMAGE_DEALT_TO_CHAMPIONS", "totalDamageDealtToChampions")),
+            int(get_raw_field(data, "CHAMPIONS_KILLED", "championsKilled")),
+            int(get_raw_field(data, "NUM_DEATHS", "numDeaths")),
+            int(get_raw_field(data, "ASSISTS", "assists")),
+            int(get_raw_field(data, "MINIONS_KILLED", "minionsKilled"))
+            + int(get_raw_field(data, "NEUTRAL_MINIONS_KILLED", "neutralMinionsKilled")),
+            int(get_raw_field(data, "VISION_SCORE", "visionScore")),
+            int(get_raw_field(data, "GOLD_SPENT", "goldSpent")),
+        )
 
     def get_name(self) -> str:
         """Returns normalized player name."""
@@ -25,7 +64,7 @@ class ParticipantData:
 
     def get_total_damage(self) -> int:
         """Returns total damage dealt to champions."""
-        return int(self._get_field("TOTAL_DAMAGE_DEALT_TO_CHAMPIONS", "totalDamageDealtToChampions"))
+        return self.total_damage
 
     def get_team(self) -> str:
         """Returns player's team."""
@@ -38,25 +77,24 @@ class ParticipantData:
 
     def get_kills(self) -> int:
         """Returns number of kills."""
-        return int(self._get_field("CHAMPIONS_KILLED", "championsKilled"))
+        return self.kills
 
     def get_deaths(self) -> int:
         """Returns number of deaths."""
-        return int(self._get_field("NUM_DEATHS", "numDeaths"))
+        return self.deaths
 
     def get_assists(self) -> int:
         """Returns number of assists."""
-        return int(self._get_field("ASSISTS", "assists"))
+        return self.assists
     
     def get_champion(self) -> str:
         """Returns champion name."""
-        return self._get_field("SKIN", "skin") or UNKNOWN_VALUE
+        # Interned since champion names are used as dict keys across every game
+        return sys.intern(self._get_field("SKIN", "skin") or UNKNOWN_VALUE)
     
     def get_cs(self) -> int:
         """Returns total CS."""
-        minions = int(self._get_field("MINIONS_KILLED", "minionsKilled"))
-        neutral = int(self._get_field("NEUTRAL_MINIONS_KILLED", "neutralMinionsKilled"))
-        return minions + neutral
+        return self.cs
 
     def get_cc_time(self) -> int:
         """Returns crowd control time."""
@@ -64,7 +102,7 @@ class ParticipantData:
 
     def get_vision_score(self) -> int:
         """Returns vision score."""
-        return int(self._get_field("VISION_SCORE", "visionScore"))
+        return self.vision_score
 
     def get_damage_taken(self) -> int:
         """Returns damage taken."""
@@ -79,7 +117,7 @@ class ParticipantData:
         return int(self._get_field("TOTAL_HEALING_ON_TEAMMATES", "totalHealingOnTeammates"))
     def get_gold_spent(self) -> int:
         """Returns total gold spent."""
-        return int(self._get_field("GOLD_SPENT", "goldSpent"))
+        return self.gold_spent
     
     def get_gold_earned(self) -> int:
         """Returns total gold earned."""
@@ -87,25 +125,26 @@ class ParticipantData:
 
     def get_damage_per_gold(self) -> float:
         """Returns damage per gold spent."""
-        gold_spent = self.get_gold_spent()
-        return self.get_total_damage() / gold_spent if gold_spent > 0 else 0.0
+        gold_spent = self.gold_spent
+        return self.total_damage / gold_spent if gold_spent > 0 else 0.0
     
     def get_level(self) -> int:
         """Returns player's level."""
-        return int(self._get_field("LEVEL", "level"))
+        return self.level
     
     def get_kda(self) -> float:
         """Returns KDA."""
-        deaths = self.get_deaths()
-        return (self.get_kills() + self.get_assists()) / deaths if deaths > 0 else self.get_kills() + self.get_assists()
+        takedowns = self.kills + self.assists
+        deaths = self.deaths
+        return takedowns / deaths if deaths > 0 else takedowns
     
     def get_win(self) -> bool:
         """Returns whether the player won the game."""
         win_value = self._get_field("WIN", "win")
-        return win_value in ["Win", "1", 1, True]
+        return win_value in WIN_VALUES
     
     def get_kill_participation(self, team_kills: int) -> float:
         """Returns kill participation."""
         if team_kills > 0:
-            return (self.get_kills() + self.get_assists()) / team_kills
+            return (self.kills + self.assists) / team_kills
         return 0.0
\ No newline at end of file
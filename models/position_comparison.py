@@ -1,19 +1,68 @@
 # MODEL: Position comparison logic and statistical calculations
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
 from models.team_analyzer import TeamAnalyzer
 from rich.table import Table
 from rich.console import Console
+from rich.text import Text
 from utils.utils import fix_encoding
 
+# Statistics shown in the comparison table, in display order
+MAIN_STATS = (
+    ('damage', 'Damage'),
+    ('kda', 'KDA'),
+    ('cs_per_minute', 'CS/min'),
+    ('vision_per_minute', 'Vision/min'),
+    ('damage_per_gold', 'Damage/Gold')
+)
+
 class PositionComparison:
     """Class to compare performance by position"""
     
+    # Non-numeric or bookkeeping fields that are not compared
+    _EXCLUDED_STATS = frozenset(('champion', 'games_played'))
+    # (value format, difference format) per statistic
+    _WHOLE_FORMATS = ('{:.0f}', '{:+.0f}')
+    _DECIMAL_FORMATS = ('{:.2f}', '{:+.2f}')
+    _STAT_FORMATS = {
+        'damage': _WHOLE_FORMATS,
+        'cs_per_minute': _WHOLE_FORMATS,
+        'kda': _DECIMAL_FORMATS,
+        'vision_per_minute': _DECIMAL_FORMATS,
+        'damage_per_gold': _DECIMAL_FORMATS
+    }
+    
+    # Static heading, built once instead of on every summary
+    _TEAM_SUMMARY_TITLE = Text.assemble("\n", ("Team Summary - Best performers by position", "bold cyan"))
+    
     def __init__(self, team_analyzer: TeamAnalyzer, console: Console):
         self.team_analyzer = team_analyzer
         self.console = console
+        self._comparison_cache: Dict[Tuple[str, str], Optional[Dict]] = {}
+        # Analyzer data version the memoized comparisons were computed from
+        self._cache_version = team_analyzer.version
+    
+    def invalidate_cache(self):
+        """Drop memoized comparisons (done automatically when the analyzer data version changes)"""
+        self._comparison_cache.clear()
+        self._cache_version = self.team_analyzer.version
     
     def compare_player_to_opponents(self, player_name: str, position: str) -> Optional[Dict]:
         """Compare a specific player to opponents in the same position"""
+        # Comparisons computed before the analyzer reloaded its games are stale
+        if self._cache_version != self.team_analyzer.version:
+            self.invalidate_cache()
+        key = (player_name, position)
+        if key not in self._comparison_cache:
+            self._comparison_cache[key] = self._compute_comparison(player_name, position)
+        return self._comparison_cache[key]
+    
+    def _compute_comparison(self, player_name: str, position: str) -> Optional[Dict]:
+        """Build the comparison of a player's averages with the opponents' averages"""
+        if not self.team_analyzer.has_player_data(player_name, position):
+            return None
+        
         player_stats = self.team_analyzer.get_player_average_stats(player_name, position)
         opponents_stats = self.team_analyzer.get_opponents_average_stats(position)
         
@@ -28,25 +77,34 @@ class PositionComparison:
             'differences': {}
         }
         
-        # Calculate differences for each statistic
-        for stat_name, player_value in player_stats.items():
-            if stat_name in opponents_stats and stat_name not in ['champion', 'games_played']:
-                opponent_value = opponents_stats[stat_name]
-                if opponent_value > 0:
-                    percentage_diff = ((player_value - opponent_value) / opponent_value) * 100
-                    comparison['differences'][stat_name] = {
-                        'absolute_diff': player_value - opponent_value,
-                        'percentage_diff': percentage_diff,
-                        'is_better': player_value > opponent_value
-                    }
+        # Calculate differences for all shared statistics at once
+        keys = [stat for stat in player_stats if stat in opponents_stats and stat not in self._EXCLUDED_STATS]
+        player_values = np.fromiter((player_stats[stat] for stat in keys), dtype=np.float64, count=len(keys))
+        opponent_values = np.fromiter((opponents_stats[stat] for stat in keys), dtype=np.float64, count=len(keys))
+        
+        absolute_diffs = player_values - opponent_values
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentage_diffs = absolute_diffs / opponent_values * 100
+        is_better = player_values > opponent_values
+        
+        for stat_name, absolute_diff, percentage_diff, better, has_opponent in zip(
+            keys, absolute_diffs.tolist(), percentage_diffs.tolist(), is_better.tolist(), (opponent_values > 0).tolist()
+        ):
+            if has_opponent:
+                comparison['differences'][stat_name] = {
+                    'absolute_diff': absolute_diff,
+                    'percentage_diff': percentage_diff,
+                    'is_better': better
+                }
         
         return comparison
     
     def _create_comparison_table(self, player_name: str, position: str) -> Table:
         """Create the comparison table with columns"""
-        table = Table(title=f"{fix_encoding(player_name)} vs Average of {position} opponents", show_header=True, header_style="bold magenta")
+        display_name = fix_encoding(player_name)
+        table = Table(title=f"{display_name} vs Average of {position} opponents", show_header=True, header_style="bold magenta")
         table.add_column("Statistic", style="cyan", width=20)
-        table.add_column(f"{fix_encoding(player_name)}", style="green", width=15)
+        table.add_column(display_name, style="green", width=15)
         table.add_column("Opponents", style="red", width=15)
         table.add_column("Difference", style="yellow", width=15)
         table.add_column("% Diff", style="magenta", width=10)
@@ -54,120 +112,138 @@ class PositionComparison:
     
     def _format_stat_values(self, stat_key: str, player_val: float, opponent_val: float, abs_diff: float) -> tuple:
         """Format statistical values for display"""
-        if stat_key in ['damage', 'cs_per_minute']:
-            player_str = f"{player_val:.0f}"
-            opponent_str = f"{opponent_val:.0f}"
-            diff_str = f"{abs_diff:+.0f}"
-        else:
-            player_str = f"{player_val:.2f}"
-            opponent_str = f"{opponent_val:.2f}"
-            diff_str = f"{abs_diff:+.2f}"
-        return player_str, opponent_str, diff_str
+        value_format, diff_format = self._STAT_FORMATS.get(stat_key, self._DECIMAL_FORMATS)
+        return value_format.format(player_val), value_format.format(opponent_val), diff_format.format(abs_diff)
     
-    def _populate_table_with_stats(self, table: Table, comparison: Dict):
-        """Populate the table with statistical data"""
-        main_stats = [
-            ('damage', 'Damage'),
-            ('kda', 'KDA'),
-            ('cs_per_minute', 'CS/min'),
-            ('vision_per_minute', 'Vision/min'),
-            ('damage_per_gold', 'Damage/Gold')
-        ]
-        
-        for stat_key, stat_display in main_stats:
-            if stat_key in comparison['player_stats'] and stat_key in comparison['differences']:
-                player_val = comparison['player_stats'][stat_key]
-                opponent_val = comparison['opponents_stats'][stat_key]
-                diff_data = comparison['differences'][stat_key]
+    def _comparison_rows(self, comparison: Dict):
+        """Yield the formatted table row of each main statistic present in the comparison"""
+        player_stats = comparison['player_stats']
+        opponents_stats = comparison['opponents_stats']
+        differences = comparison['differences']
+        for stat_key, stat_display in MAIN_STATS:
+            if stat_key in player_stats and stat_key in differences:
+                diff_data = differences[stat_key]
                 
                 player_str, opponent_str, diff_str = self._format_stat_values(
-                    stat_key, player_val, opponent_val, diff_data['absolute_diff']
+                    stat_key, player_stats[stat_key], opponents_stats[stat_key], diff_data['absolute_diff']
                 )
                 
-                pct_color = "green" if diff_data['is_better'] else "red"
-                pct_str = f"[{pct_color}]{diff_data['percentage_diff']:+.1f}%[/{pct_color}]"
+                # Styled Text skips Rich markup parsing when the cell is rendered
+                pct_str = Text(f"{diff_data['percentage_diff']:+.1f}%", style="green" if diff_data['is_better'] else "red")
                 
-                table.add_row(stat_display, player_str, opponent_str, diff_str, pct_str)
+                yield stat_display, player_str, opponent_str, diff_str, pct_str
+    
+    def _populate_table_with_stats(self, table: Table, comparison: Dict):
+        """Populate the table with statistical data"""
+        add_row = table.add_row
+        for row in self._comparison_rows(comparison):
+            add_row(*row)
 
     def display_player_comparison(self, player_name: str, position: str):
         """Display the comparison of a player with opponents"""
         comparison = self.compare_player_to_opponents(player_name, position)
         
         if not comparison:
-            self.console.print(f"[red]No data available for {player_name} in position {position}[/red]")
+            self.console.print(Text(f"No data available for {player_name} in position {position}", style="red"))
             return
             
-        self.console.print(f"\n[bold cyan]Comparison: {fix_encoding(player_name)} ({position}) vs Opponents[/bold cyan]")
+        display_name = fix_encoding(player_name)
+        self.console.print(Text.assemble("\n", (f"Comparison: {display_name} ({position}) vs Opponents", "bold cyan")))
         
         table = self._create_comparison_table(player_name, position)
         self._populate_table_with_stats(table, comparison)
         self.console.print(table)
         
-        # Additional information
-        self.console.print(f"\n[dim]Games played by {fix_encoding(player_name)}: {comparison['player_stats']['games_played']}[/dim]")
-        self.console.print(f"[dim]Opponent games analyzed: {comparison['opponents_stats']['games_played']}[/dim]")
-        self.console.print(f"[dim]Most played champion by {fix_encoding(player_name)}: {comparison['player_stats']['champion']}[/dim]")
+        # Additional information, written in a single print
+        self.console.print(Text.assemble(
+            "\n",
+            (f"Games played by {display_name}: {comparison['player_stats']['games_played']}", "dim"),
+            "\n",
+            (f"Opponent games analyzed: {comparison['opponents_stats']['games_played']}", "dim"),
+            "\n",
+            (f"Most played champion by {display_name}: {comparison['player_stats']['champion']}", "dim")
+        ))
+    
+    def get_position_summary_df(self, position: str) -> pd.DataFrame:
+        """Damage and KDA difference % vs opponents of every player at a position (0 when opponents have none)"""
+        columns = ['player', 'damage_diff_pct', 'kda_diff_pct']
+        opponents_stats = self.team_analyzer.get_opponents_average_stats(position)
+        if not opponents_stats:
+            return pd.DataFrame(columns=columns)
+        
+        has_player_data = self.team_analyzer.has_player_data
+        rows = []
+        for player in self.team_analyzer.get_our_players_by_position(position):
+            if has_player_data(player, position):
+                player_stats = self.team_analyzer.get_player_average_stats(player, position)
+                rows.append((player, player_stats['damage'], player_stats['kda']))
+        players_df = pd.DataFrame(rows, columns=['player', 'damage', 'kda'])
+        
+        summary = players_df[['player']].copy()
+        for stat in ('damage', 'kda'):
+            opponent_value = opponents_stats[stat]
+            pct = (players_df[stat] - opponent_value) / opponent_value * 100 if opponent_value > 0 else 0.0
+            summary[f'{stat}_diff_pct'] = pct
+        return summary
     
     def display_position_overview(self, position: str):
         """Display an overview of all our players at a position vs opponents"""
         our_players = self.team_analyzer.get_our_players_by_position(position)
         
         if not our_players:
-            self.console.print(f"[red]No players found in position {position}[/red]")
+            self.console.print(Text(f"No players found in position {position}", style="red"))
             return
         
-        self.console.print(f"\n[bold cyan]Overview of position {position}[/bold cyan]")
-        
-        for player in our_players:
-            comparison = self.compare_player_to_opponents(player, position)
-            if comparison:
-                # Quick summary
-                damage_diff = comparison['differences'].get('damage', {}).get('percentage_diff', 0)
-                kda_diff = comparison['differences'].get('kda', {}).get('percentage_diff', 0)
-                
-                damage_color = "green" if damage_diff > 0 else "red"
-                kda_color = "green" if kda_diff > 0 else "red"
-                self.console.print(f"  • {fix_encoding(player)}: "
-                                 f"Damage [{damage_color}]{damage_diff:+.1f}%[/{damage_color}], "
-                                 f"KDA [{kda_color}]{kda_diff:+.1f}%[/{kda_color}]")
+        summary = self.get_position_summary_df(position)
+        # Header and one quick summary line per player, written in a single print
+        lines = [Text.assemble("\n", (f"Overview of position {position}", "bold cyan"))]
+        lines.extend(
+            Text.assemble(
+                f"  • {fix_encoding(player)}: Damage ",
+                (f"{damage_diff:+.1f}%", "green" if damage_diff > 0 else "red"),
+                ", KDA ",
+                (f"{kda_diff:+.1f}%", "green" if kda_diff > 0 else "red")
+            )
+            for player, damage_diff, kda_diff in zip(
+                summary['player'], summary['damage_diff_pct'].tolist(), summary['kda_diff_pct'].tolist()
+            )
+        )
+        self.console.print(Text("\n").join(lines))
     
-    def get_best_performers_by_position(self) -> Dict[str, List]:
-        """Identify our best players by position based on damage"""
-        best_performers = {}
-        
+    def get_best_performers_with_diffs(self) -> pd.DataFrame:
+        """Best player by damage of every position with their damage and KDA difference % vs opponents"""
+        rows = []
+        # The best player and damage difference come from the analyzer, only the KDA difference is added here
+        for position, (player, damage_diff) in self.team_analyzer.get_best_damage_per_position().items():
+            player_kda = self.team_analyzer.get_player_average_stats(player, position)['kda']
+            opponent_kda = self.team_analyzer.get_opponents_average_stats(position)['kda']
+            # KDA difference is 0 when opponents have none
+            kda_diff = (player_kda - opponent_kda) / opponent_kda * 100 if opponent_kda > 0 else 0.0
+            rows.append((position, player, damage_diff, kda_diff))
+        return pd.DataFrame(rows, columns=['position', 'player', 'damage_diff', 'kda_diff'])
+    
+    def _team_summary_rows(self, best_damage: Dict[str, Tuple[str, float]]):
+        """Yield the formatted team summary row of every played position"""
         for position in self.team_analyzer.get_all_positions():
-            our_players = self.team_analyzer.get_our_players_by_position(position)
-            position_performances = []
-            
-            for player in our_players:
-                comparison = self.compare_player_to_opponents(player, position)
-                if comparison and 'damage' in comparison['differences']:
-                    damage_diff = comparison['differences']['damage']['percentage_diff']
-                    position_performances.append((player, damage_diff))
-            
-            # Sort by damage difference (descending)
-            position_performances.sort(key=lambda x: x[1], reverse=True)
-            best_performers[position] = position_performances
-        
-        return best_performers
+            if position in best_damage:
+                best_player, damage_diff = best_damage[position]
+                diff_str = Text(f"{damage_diff:+.1f}%", style="green" if damage_diff > 0 else "red")
+                yield position, fix_encoding(best_player), diff_str
+            else:
+                yield position, "No player", "-"
     
     def display_team_summary(self):
         """Display a team summary with the best performers"""
-        self.console.print("\n[bold cyan]Team Summary - Best performers by position[/bold cyan]")
+        self.console.print(self._TEAM_SUMMARY_TITLE)
         
-        best_performers = self.get_best_performers_by_position()
+        best_damage = self.team_analyzer.get_best_damage_per_position()
         
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Position", style="cyan", width=12)
         table.add_column("Best player", style="green", width=20)
         table.add_column("Damage diff vs opponents", style="yellow", width=25)
-        for position, performers in best_performers.items():
-            if performers:
-                best_player, damage_diff = performers[0]
-                diff_color = "green" if damage_diff > 0 else "red"
-                diff_str = f"[{diff_color}]{damage_diff:+.1f}%[/{diff_color}]"
-                table.add_row(position, fix_encoding(best_player), diff_str)
-            else:
-                table.add_row(position, "No player", "-")
+        add_row = table.add_row
+        for row in self._team_summary_rows(best_damage):
+            add_row(*row)
         
         self.console.print(table)
@@ -1,45 +1,118 @@
 # MODEL: Team analysis logic and business rules for Marmotte Flip vs opponents
-from typing import Dict, List, Set, Optional
-from collections import defaultdict
+from typing import Dict, List, Set, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import count
+from operator import attrgetter
 import os
 import json
+import numpy as np
 from models.game_data import GameData
 from models.participant_data import ParticipantData
-from utils.utils import fix_encoding, normalize_player_name, normalize_position
+from utils.utils import fix_encoding, normalize_player_name, normalize_player_names, normalize_position
 from constants import TARGET_PLAYER, POSITIONS
 
+# Numeric per-game statistics, in the column order of the stat matrices
+STAT_COLUMNS = (
+    'damage', 'damage_per_minute', 'kda', 'kills', 'deaths', 'assists', 'cs', 'cs_per_minute',
+    'vision_score', 'vision_per_minute', 'damage_per_gold', 'gold_spent', 'level'
+)
+
+# Reads the STAT_COLUMNS values of a PlayerGameStats as a tuple
+_stat_values = attrgetter(*STAT_COLUMNS)
+
+# Metrics normalized to position percentages, and which of them are "higher is better"
+NORMALIZED_METRICS = ('kills', 'deaths', 'assists', 'damage_per_minute', 'cs_per_minute', 'vision_per_minute', 'kda')
+HIGHER_IS_BETTER = np.array([metric != 'deaths' for metric in NORMALIZED_METRICS])
+NORMALIZED_COLUMNS = [STAT_COLUMNS.index(metric) for metric in NORMALIZED_METRICS]
+DAMAGE_COLUMN = STAT_COLUMNS.index('damage')
+
+# Below this number of files, loading them serially is cheaper than starting a thread pool
+PARALLEL_LOAD_THRESHOLD = 8
+
+# Process-wide data versions, so cache keys never collide between analyzers
+_data_versions = count(1)
+
+
+@dataclass(slots=True)
+class PlayerGameStats:
+    """Statistics of one participant in one game"""
+    damage: int
+    damage_per_minute: float
+    kda: float
+    kills: int
+    deaths: int
+    assists: int
+    cs: int
+    cs_per_minute: float
+    vision_score: int
+    vision_per_minute: float
+    damage_per_gold: float
+    gold_spent: int
+    level: int
+    champion: str
+
+
 class TeamAnalyzer:
     """Class to analyze Marmotte Flip vs opponents"""
     
     def __init__(self, data_directory: str = "data"):
         self.data_directory = data_directory
         self.target_player = TARGET_PLAYER  # Use centralized constant
+        self._norm_target = normalize_player_name(self.target_player)
         self.marmotte_flip_players: Set[str] = set()
-        self.our_players_stats: Dict[str, Dict] = defaultdict(lambda: defaultdict(list))
-        self.opponents_stats: Dict[str, Dict] = defaultdict(lambda: defaultdict(list))
+        self._marmotte_flip_sorted_normalized: List[str] = [self._norm_target]
+        self.our_players_stats: Dict[str, Dict[str, List[PlayerGameStats]]] = {}
+        self.opponents_stats: Dict[str, Dict[str, List[PlayerGameStats]]] = {}
+        self._our_players_matrices: Dict[str, Dict[str, np.ndarray]] = {}
+        self._opponents_matrices: Dict[str, np.ndarray] = {}
+        self._player_mean_rows: Dict[str, Dict[str, np.ndarray]] = {}
+        self._player_avg: Dict[str, Dict[str, Dict]] = {}
+        self._opponent_avg: Dict[str, Dict] = {}
+        self._team_avg_per_minute: Dict[str, Dict] = {}
+        self._opponent_avg_per_minute: Dict[str, Dict] = {}
+        self._range_cache: Dict[str, Dict] = {}
+        self._players_by_position: Dict[str, Tuple[str, ...]] = {}
+        self._best_damage: Optional[Dict[str, Tuple[str, float]]] = None
+        self._available_pairs: frozenset = frozenset()
+        self._positions: List[str] = []
         self.games_analyzed = 0
+        self.version = 0  # Bumped every time loaded data changes, usable as a cache key
         
     def load_and_analyze_all_games(self):
         """Load and analyze all games to identify Marmotte Flip players and opponents"""
         print("Analyzing games to identify Marmotte Flip team...")
 
-        self._identify_marmotte_flip_players()
-        self._collect_statistics()
+        games = self._load_games()
+        self._identify_marmotte_flip_players(games)
+        self._collect_statistics(games)
+        self._finalize()
         
         print(f"Analysis completed: {self.games_analyzed} games analyzed")
         print(f"Marmotte Flip players identified: {len(self.marmotte_flip_players)}")
         print(f"Marmotte Flip players: {', '.join(sorted(self.marmotte_flip_players))}")
     
-    def _identify_marmotte_flip_players(self):
-        """First pass to identify all Marmotte Flip players"""
-        json_files = [f for f in os.listdir(self.data_directory) if f.endswith('.json')]
+    def _load_games(self) -> List[GameData]:
+        """Load every game file of the data directory once, skipping unreadable ones"""
+        file_paths = [
+            os.path.join(self.data_directory, filename)
+            for filename in os.listdir(self.data_directory) if filename.endswith('.json')
+        ]
+        
+        if len(file_paths) < PARALLEL_LOAD_THRESHOLD:
+            games = [GameData(file_path) for file_path in file_paths]
+        else:
+            # Overlap file reads with JSON parsing
+            with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as executor:
+                games = list(executor.map(GameData, file_paths))
         
-        for filename in json_files:
-            file_path = os.path.join(self.data_directory, filename)
-            game = GameData(file_path)
-            
-            if game.data:
-                self._process_game_for_team_identification(game)
+        return [game for game in games if game.data]
+    
+    def _identify_marmotte_flip_players(self, games: List[GameData]):
+        """First pass to identify all Marmotte Flip players"""
+        for game in games:
+            self._process_game_for_team_identification(game)
     
     def _process_game_for_team_identification(self, game: GameData):
         """Process a single game to identify team members"""
@@ -50,7 +123,7 @@ class TeamAnalyzer:
     def _find_target_player(self, game: GameData) -> Optional[ParticipantData]:
         """Find the target player in the game"""
         for participant in game.get_all_participants():
-            if normalize_player_name(participant.get_name()) == normalize_player_name(self.target_player):
+            if normalize_player_name(participant.get_name()) == self._norm_target:
                 return participant
         return None
     
@@ -59,19 +132,13 @@ class TeamAnalyzer:
         for participant in game.get_all_participants():
             player_name = normalize_player_name(participant.get_name())
             if (participant.get_team() == team_id and 
-                player_name != normalize_player_name(self.target_player)):
+                player_name != self._norm_target):
                 self.marmotte_flip_players.add(player_name)
     
-    def _collect_statistics(self):
+    def _collect_statistics(self, games: List[GameData]):
         """Second pass to collect player statistics"""
-        json_files = [f for f in os.listdir(self.data_directory) if f.endswith('.json')]
-        
-        for filename in json_files:
-            file_path = os.path.join(self.data_directory, filename)
-            game = GameData(file_path)
-            
-            if game.data:
-                self._process_game_for_statistics(game)
+        for game in games:
+            self._process_game_for_statistics(game)
     
     def _process_game_for_statistics(self, game: GameData):
         """Process a single game to collect statistics"""
@@ -82,141 +149,193 @@ class TeamAnalyzer:
             player_stats = self._create_player_stats(participant, game_duration)
             self._classify_and_store_player_stats(participant, player_stats)
     
-    def _create_player_stats(self, participant: ParticipantData, game_duration: float) -> Dict:
-        """Create statistics dictionary for a participant"""
+    def _create_player_stats(self, participant: ParticipantData, game_duration: float) -> PlayerGameStats:
+        """Create the game statistics record of a participant"""
         game_minutes = game_duration / 60 if game_duration > 0 else 1
-        
-        return {
-            'damage': participant.get_total_damage(),
-            'damage_per_minute': participant.get_total_damage() / game_minutes,
-            'kda': participant.get_kda(),
-            'kills': participant.get_kills(),
-            'deaths': participant.get_deaths(),
-            'assists': participant.get_assists(),
-            'cs': participant.get_cs(),
-            'cs_per_minute': participant.get_cs() / game_minutes,
-            'vision_score': participant.get_vision_score(),
-            'vision_per_minute': participant.get_vision_score() / game_minutes,
-            'damage_per_gold': participant.get_damage_per_gold(),
-            'gold_spent': participant.get_gold_spent(),
-            'level': participant.get_level(),
-            'champion': participant.get_champion()
-        }
-        
-    def _classify_and_store_player_stats(self, participant: ParticipantData, player_stats: Dict):
+        per_minute = 1.0 / game_minutes
+        damage = participant.get_total_damage()
+        cs = participant.get_cs()
+        vision_score = participant.get_vision_score()
+        
+        return PlayerGameStats(
+            damage=damage,
+            damage_per_minute=damage * per_minute,
+            kda=participant.get_kda(),
+            kills=participant.get_kills(),
+            deaths=participant.get_deaths(),
+            assists=participant.get_assists(),
+            cs=cs,
+            cs_per_minute=cs * per_minute,
+            vision_score=vision_score,
+            vision_per_minute=vision_score * per_minute,
+            damage_per_gold=participant.get_damage_per_gold(),
+            gold_spent=participant.get_gold_spent(),
+            level=participant.get_level(),
+            champion=participant.get_champion()
+        )
+        
+    def _classify_and_store_player_stats(self, participant: ParticipantData, player_stats: PlayerGameStats):
         """Classify player as teammate or opponent and store their stats"""
         player_name = normalize_player_name(participant.get_name())
         position = normalize_position(participant.get_position())  # Use normalized position
         
         if self._is_marmotte_flip_player(player_name):
-            self.our_players_stats[position][player_name].append(player_stats)
+            self.our_players_stats.setdefault(position, {}).setdefault(player_name, []).append(player_stats)
         else:
-            self.opponents_stats[position]['opponents'].append(player_stats)
+            self.opponents_stats.setdefault(position, {}).setdefault('opponents', []).append(player_stats)
     
     def _is_marmotte_flip_player(self, player_name: str) -> bool:
-        """Check if a player is part of Marmotte Flip team"""
-        normalized_name = normalize_player_name(player_name)
-        normalized_target = normalize_player_name(self.target_player)
-        return normalized_name == normalized_target or normalized_name in self.marmotte_flip_players
+        """Check if a player is part of Marmotte Flip team (expects a normalized name)"""
+        return player_name == self._norm_target or player_name in self.marmotte_flip_players
+    
+    def _finalize(self):
+        """Convert collected per-game stats into NumPy matrices and precompute averages"""
+        self._our_players_matrices = {
+            position: {player: self._build_stat_matrix(games) for player, games in players.items()}
+            for position, players in self.our_players_stats.items()
+        }
+        self._opponents_matrices = {
+            position: self._build_stat_matrix(groups.get('opponents', []))
+            for position, groups in self.opponents_stats.items()
+        }
+        
+        # Data is frozen once loaded, so averages are computed only once
+        self._player_mean_rows = {
+            position: {player: matrix.mean(axis=0) for player, matrix in players.items() if len(matrix)}
+            for position, players in self._our_players_matrices.items()
+        }
+        self._player_avg = {
+            position: {
+                player: self._average_stats(row, self.our_players_stats[position][player])
+                for player, row in rows.items()
+            }
+            for position, rows in self._player_mean_rows.items()
+        }
+        # (player, position) pairs with averaged stats, for cheap availability checks
+        self._available_pairs = frozenset(
+            (player, position) for position, players in self._player_avg.items() for player in players
+        )
+        self._opponent_avg = {
+            position: self._average_stats(matrix.mean(axis=0), self.opponents_stats[position]['opponents'])
+            for position, matrix in self._opponents_matrices.items() if len(matrix)
+        }
+        self._opponent_avg_per_minute = {
+            position: self._mean_row(matrix[:, NORMALIZED_COLUMNS])
+            for position, matrix in self._opponents_matrices.items() if len(matrix)
+        }
+        self._team_avg_per_minute = {
+            position: self._mean_row(np.vstack(list(rows.values()))[:, NORMALIZED_COLUMNS])
+            for position, rows in self._player_mean_rows.items() if rows
+        }
+        self._players_by_position = {
+            position: tuple(players) for position, players in self.our_players_stats.items()
+        }
+        self._positions = [pos for pos in POSITIONS if self._players_by_position.get(pos)]
+        self._marmotte_flip_sorted_normalized = sorted(
+            set(normalize_player_names(self.marmotte_flip_players)) | {self._norm_target}
+        )
+        self.invalidate_cache()
+    
+    def invalidate_cache(self):
+        """Clear values derived from the collected statistics"""
+        self.version = next(_data_versions)
+        self._range_cache.clear()
+        self._best_damage = None
+    
+    @staticmethod
+    def _build_stat_matrix(games: List[PlayerGameStats]) -> np.ndarray:
+        """Stack numeric per-game stats into a (games, STAT_COLUMNS) matrix"""
+        matrix = np.array([_stat_values(game) for game in games], dtype=np.float64)
+        return matrix.reshape(len(games), len(STAT_COLUMNS))
+    
+    @staticmethod
+    def _average_stats(mean_row: np.ndarray, games: List[PlayerGameStats]) -> Dict:
+        """Turn a column-wise mean row into a stats dictionary and add the most played champion"""
+        avg_stats = dict(zip(STAT_COLUMNS, mean_row.tolist()))
+        # For champions, take the most played one
+        avg_stats['champion'] = Counter(game.champion for game in games).most_common(1)[0][0]
+        avg_stats['games_played'] = len(games)
+        return avg_stats
     
     def get_our_players_by_position(self, position: str) -> List[str]:
         """Returns the list of Marmotte Flip players for a given position"""
-        if position in self.our_players_stats:
-            return list(self.our_players_stats[position].keys())
-        return []
+        return list(self._players_by_position.get(position, ()))
+    
+    def get_players_by_position_map(self) -> Dict[str, Tuple[str, ...]]:
+        """Returns the Marmotte Flip players of every played position, built once at load time"""
+        return {position: self._players_by_position[position] for position in self._positions}
+    
+    def has_player_data(self, player_name: str, position: str) -> bool:
+        """Whether a player has statistics at a position"""
+        return (player_name, position) in self._available_pairs
     
     def get_player_average_stats(self, player_name: str, position: str) -> Optional[Dict]:
-        """Calculates average statistics for a player at a position"""
-        if (position in self.our_players_stats and 
-            player_name in self.our_players_stats[position]):
-            
-            games = self.our_players_stats[position][player_name]
-            if not games:
-                return None
-            
-            avg_stats = {}
-            for stat_name in games[0].keys():
-                if stat_name == 'champion':
-                    # For champions, take the most played one
-                    champions = [game[stat_name] for game in games]
-                    avg_stats[stat_name] = max(set(champions), key=champions.count)
-                else:
-                    # For numerical stats, calculate the average
-                    avg_stats[stat_name] = sum(game[stat_name] for game in games) / len(games)
-            
-            avg_stats['games_played'] = len(games)
-            return avg_stats
-        return None
+        """Returns a copy of the average statistics for a player at a position"""
+        stats = self._player_avg.get(position, {}).get(player_name)
+        return dict(stats) if stats is not None else None
     
     def get_opponents_average_stats(self, position: str) -> Optional[Dict]:
-        """Calculates average statistics for opponents at a position"""
-        if (position in self.opponents_stats and 
-            'opponents' in self.opponents_stats[position]):
-            
-            games = self.opponents_stats[position]['opponents']
-            if not games:
-                return None
-            
-            avg_stats = {}
-            for stat_name in games[0].keys():
-                if stat_name == 'champion':
-                    # For champions, take the most played one
-                    champions = [game[stat_name] for game in games]
-                    avg_stats[stat_name] = max(set(champions), key=champions.count)
-                else:
-                    # For numerical stats, calculate the average
-                    avg_stats[stat_name] = sum(game[stat_name] for game in games) / len(games)
-            
-            avg_stats['games_played'] = len(games)
-            return avg_stats
-        return None
+        """Returns a copy of the average statistics for opponents at a position"""
+        stats = self._opponent_avg.get(position)
+        return dict(stats) if stats is not None else None
+    
+    def get_best_damage_per_position(self) -> Dict[str, Tuple[str, float]]:
+        """Returns the best (player, damage difference % vs opponents) per position, when opponents dealt damage"""
+        if self._best_damage is None:
+            self._best_damage = {}
+            for position in self._positions:
+                opponents_stats = self._opponent_avg.get(position)
+                rows = self._player_mean_rows.get(position)
+                if not opponents_stats or not rows or opponents_stats['damage'] <= 0:
+                    continue
+                players = list(rows)
+                damages = np.array([row[DAMAGE_COLUMN] for row in rows.values()])
+                damage_pct = (damages - opponents_stats['damage']) / opponents_stats['damage'] * 100
+                # argmax keeps the first player on ties
+                best = int(np.argmax(damage_pct))
+                self._best_damage[position] = (players[best], float(damage_pct[best]))
+        return self._best_damage
     
     def get_marmotte_flip_players_list(self) -> List[str]:
-        """Get list of Marmotte Flip players with normalized names"""
-        all_players = list(self.marmotte_flip_players)
-        if normalize_player_name(self.target_player) not in [normalize_player_name(p) for p in all_players]:
-            all_players.append(self.target_player)
-        return [normalize_player_name(player) for player in sorted(all_players)]
+        """Get sorted list of Marmotte Flip players (including the target player) with normalized names"""
+        return list(self._marmotte_flip_sorted_normalized)
     
     def get_all_positions(self) -> List[str]:
         """Get all positions that have been played by team members"""
-        return [pos for pos in POSITIONS if pos in self.our_players_stats and self.our_players_stats[pos]]
+        return list(self._positions)
     
-    def _collect_all_player_stats(self, position: str) -> List[Dict]:
-        """Collect all player stats for a position from both our team and opponents"""
-        all_stats = []
-        
-        # Get our players stats
-        if position in self.our_players_stats:
-            for player_games in self.our_players_stats[position].values():
-                all_stats.extend(player_games)
-        
-        # Get opponents stats  
-        if position in self.opponents_stats:
-            all_stats.extend(self.opponents_stats[position]['opponents'])
-        
-        return all_stats
+    def _collect_all_player_stats(self, position: str) -> np.ndarray:
+        """Stack the stat matrices of our players and opponents for a position"""
+        matrices = list(self._our_players_matrices.get(position, {}).values())
+        if position in self._opponents_matrices:
+            matrices.append(self._opponents_matrices[position])
+        
+        if not matrices:
+            return np.empty((0, len(STAT_COLUMNS)))
+        return np.vstack(matrices)
     
-    def _calculate_metric_range(self, metric: str, all_stats: List[Dict]) -> Dict[str, float]:
+    def _calculate_metric_range(self, metric: str, all_stats: np.ndarray) -> Dict[str, float]:
         """Calculate min, max, and range for a specific metric"""
-        values = [stats[metric] for stats in all_stats if metric in stats]
+        values = all_stats[:, STAT_COLUMNS.index(metric)]
         
-        if not values:
+        if not values.size:
             return {}
         
-        min_val = min(values)
-        max_val = max(values)
         return {
-            'min': min_val,
-            'max': max_val,
-            'range': max_val - min_val if max_val != min_val else 1
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'range': float(np.ptp(values)) or 1.0
         }
 
     def get_position_statistics_range(self, position: str) -> Dict[str, Dict[str, float]]:
         """Get the min and max values for each statistic in a position for normalization"""
+        if position in self._range_cache:
+            return self._range_cache[position]
+        
         all_players_stats = self._collect_all_player_stats(position)
         
-        if not all_players_stats:
+        if not len(all_players_stats):
+            self._range_cache[position] = {}
             return {}
         
         # Define the metrics we want to analyze (using per-minute versions)
@@ -228,107 +347,52 @@ class TeamAnalyzer:
             if metric_range:
                 stats_ranges[metric] = metric_range
         
+        self._range_cache[position] = stats_ranges
         return stats_ranges
     
-    def _normalize_metric_higher_is_better(self, value: float, min_val: float, max_val: float) -> float:
-        """Normalize a metric where higher values are better"""
-        if max_val == min_val:
-            return 50.0  # If all values are the same
-        
-        percentage = ((value - min_val) / (max_val - min_val)) * 100
-        return max(0, min(100, percentage))
-    
-    def _normalize_metric_lower_is_better(self, value: float, min_val: float, max_val: float) -> float:
-        """Normalize a metric where lower values are better (inverted)"""
-        if max_val == min_val:
-            return 50.0  # If all values are the same
-        
-        percentage = ((max_val - value) / (max_val - min_val)) * 100
-        return max(0, min(100, percentage))
-    
-    def _normalize_single_metric(self, metric: str, stats: Dict, ranges: Dict, is_higher_better: bool) -> Optional[float]:
-        """Normalize a single metric to percentage"""
-        if metric not in stats or metric not in ranges:
-            return None
-        
-        value = stats[metric]
-        min_val = ranges[metric]['min']
-        max_val = ranges[metric]['max']
-        
-        if is_higher_better:
-            return self._normalize_metric_higher_is_better(value, min_val, max_val)
-        else:
-            return self._normalize_metric_lower_is_better(value, min_val, max_val)
+    @staticmethod
+    def _normalize_batch(values: np.ndarray, mins: np.ndarray, maxs: np.ndarray, higher_is_better: np.ndarray) -> np.ndarray:
+        """Normalize metric values to 0-100 within their range (inverted where lower is better)"""
+        spans = maxs - mins
+        distances = np.where(higher_is_better, values - mins, maxs - values)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentages = np.clip(distances / spans * 100, 0, 100)
+        # If all values are the same
+        return np.where(spans == 0, 50.0, percentages)
 
     def normalize_stats_to_percentage(self, stats: Dict, position: str) -> Dict[str, float]:
         """Convert stats to normalized percentages (0-100) based on position ranges"""
+        return self._normalize_stats_rows([stats], position)[0]
+    
+    def _normalize_stats_rows(self, stats_rows: List[Dict], position: str) -> List[Dict[str, float]]:
+        """Normalize several stat dictionaries to percentages in a single batch, on the metrics they all have"""
         ranges = self.get_position_statistics_range(position)
-        normalized_stats = {}
-        
-        # Metrics that are "higher is better" 
-        higher_is_better = ['kills', 'assists', 'damage_per_minute', 'cs_per_minute', 'vision_per_minute', 'kda']
-        # Metrics that are "lower is better"
-        lower_is_better = ['deaths']
+        indices = [i for i, metric in enumerate(NORMALIZED_METRICS)
+                   if metric in ranges and all(metric in stats for stats in stats_rows)]
         
-        # Process higher-is-better metrics
-        for metric in higher_is_better:
-            normalized = self._normalize_single_metric(metric, stats, ranges, True)
-            if normalized is not None:
-                normalized_stats[metric] = normalized
+        if not indices:
+            return [{} for _ in stats_rows]
         
-        # Process lower-is-better metrics
-        for metric in lower_is_better:
-            normalized = self._normalize_single_metric(metric, stats, ranges, False)
-            if normalized is not None:
-                normalized_stats[metric] = normalized
+        metrics = [NORMALIZED_METRICS[i] for i in indices]
+        values = np.array([[stats[metric] for metric in metrics] for stats in stats_rows], dtype=np.float64)
+        mins = np.array([ranges[metric]['min'] for metric in metrics])
+        maxs = np.array([ranges[metric]['max'] for metric in metrics])
         
-        return normalized_stats
+        normalized = self._normalize_batch(values, mins, maxs, HIGHER_IS_BETTER[indices]).tolist()
+        return [dict(zip(metrics, row)) for row in normalized]
+    
+    @staticmethod
+    def _mean_row(matrix: np.ndarray) -> Dict[str, float]:
+        """Average a (rows, NORMALIZED_METRICS) matrix into a metric dictionary"""
+        return dict(zip(NORMALIZED_METRICS, matrix.mean(axis=0).tolist()))
     
     def get_team_average_stats_with_per_minute(self, position: str) -> Optional[Dict]:
-        """Get average stats for our team at a position, including per-minute metrics"""
-        our_players = self.get_our_players_by_position(position)
-        our_player_stats_list = []
-        
-        for player in our_players:
-            player_stats = self.get_player_average_stats(player, position)
-            if player_stats:
-                our_player_stats_list.append(player_stats)
-        
-        if not our_player_stats_list:
-            return None
-        
-        # Calculate averages including per-minute metrics
-        avg_stats = {
-            'kills': sum(stats.get('kills', 0) for stats in our_player_stats_list) / len(our_player_stats_list),
-            'deaths': sum(stats.get('deaths', 0) for stats in our_player_stats_list) / len(our_player_stats_list),
-            'assists': sum(stats.get('assists', 0) for stats in our_player_stats_list) / len(our_player_stats_list),
-            'damage_per_minute': sum(stats.get('damage_per_minute', 0) for stats in our_player_stats_list) / len(our_player_stats_list),
-            'cs_per_minute': sum(stats.get('cs_per_minute', 0) for stats in our_player_stats_list) / len(our_player_stats_list),
-            'vision_per_minute': sum(stats.get('vision_per_minute', 0) for stats in our_player_stats_list) / len(our_player_stats_list),
-            'kda': sum(stats.get('kda', 0) for stats in our_player_stats_list) / len(our_player_stats_list)
-        }
-        
-        return avg_stats
+        """Get average stats for our team at a position (average of the players' averages), including per-minute metrics"""
+        return self._team_avg_per_minute.get(position)
     
     def get_opponents_average_stats_with_per_minute(self, position: str) -> Optional[Dict]:
         """Get average stats for opponents at a position, including per-minute metrics"""
-        if position in self.opponents_stats:
-            games = self.opponents_stats[position]['opponents']
-            if not games:
-                return None
-            
-            avg_stats = {
-                'kills': sum(game.get('kills', 0) for game in games) / len(games),
-                'deaths': sum(game.get('deaths', 0) for game in games) / len(games),
-                'assists': sum(game.get('assists', 0) for game in games) / len(games),
-                'damage_per_minute': sum(game.get('damage_per_minute', 0) for game in games) / len(games),
-                'cs_per_minute': sum(game.get('cs_per_minute', 0) for game in games) / len(games),
-                'vision_per_minute': sum(game.get('vision_per_minute', 0) for game in games) / len(games),
-                'kda': sum(game.get('kda', 0) for game in games) / len(games)
-            }
-            
-            return avg_stats
-        return None
+        return self._opponent_avg_per_minute.get(position)
     
     def get_position_comparison_with_percentages(self, position: str) -> Optional[Dict]:
         """Get position comparison data with normalized percentages"""
@@ -339,8 +403,7 @@ class TeamAnalyzer:
             return None
         
         # Normalize both to percentages
-        our_normalized = self.normalize_stats_to_percentage(our_stats, position)
-        opponent_normalized = self.normalize_stats_to_percentage(opponent_stats, position)
+        our_normalized, opponent_normalized = self._normalize_stats_rows([our_stats, opponent_stats], position)
         
         return {
             'our_stats_raw': our_stats,
@@ -363,8 +426,7 @@ class TeamAnalyzer:
             return None
         
         # Normalize both to percentages
-        player_normalized = self.normalize_stats_to_percentage(player_stats, position)
-        opponent_normalized = self.normalize_stats_to_percentage(opponent_stats, position)
+        player_normalized, opponent_normalized = self._normalize_stats_rows([player_stats, opponent_stats], position)
         
         return {
             'our_stats_raw': player_stats,
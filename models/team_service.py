@@ -13,14 +13,20 @@ class TeamService:
     def __init__(self, team_analyzer=None):
         self.team_analyzer = team_analyzer
         self._marmotte_flip_players = None
+        self._player_options = None
+        self._name_reverse = None
+        self._selection_index = None
+        self._options_by_display = None
     
     def get_marmotte_flip_players(self) -> List[str]:
         """Get list of all Marmotte Flip players (normalized names)"""
         if self._marmotte_flip_players is None and self.team_analyzer:
-            raw_players = self.team_analyzer.get_marmotte_flip_players_list()
-            if TARGET_PLAYER not in raw_players:
-                raw_players.append(TARGET_PLAYER)
-            self._marmotte_flip_players = [normalize_player_name(p) for p in raw_players]
+            # Names are already normalized by the analyzer
+            players = list(self.team_analyzer.get_marmotte_flip_players_list())
+            target_player = normalize_player_name(TARGET_PLAYER)
+            if target_player not in players:
+                players.append(target_player)
+            self._marmotte_flip_players = players
         return self._marmotte_flip_players or []
     
     def get_team_players_by_position(self) -> Dict[str, List[str]]:
@@ -31,28 +37,45 @@ class TeamService:
     
     def get_player_options_for_ui(self) -> List[Tuple[str, str, str]]:
         """Get player options formatted for UI display: (display_name, position, original_name)"""
-        options = []
-        team_players = self.get_team_players_by_position()
-        
-        for position, players in team_players.items():
-            for normalized_name in players:
-                # Find original name from analyzer
-                original_name = self._find_original_player_name(normalized_name, position)
-                display_name = f"{normalized_name} ({get_position_display_name(position, short=True)})"
-                options.append((display_name, position, original_name))
-        
-        return sorted(options)
+        if self._player_options is None and self.team_analyzer:
+            options = []
+            team_players = self.get_team_players_by_position()
+            
+            for position, players in team_players.items():
+                for normalized_name in players:
+                    # Find original name from analyzer
+                    original_name = self._find_original_player_name(normalized_name, position)
+                    display_name = f"{normalized_name} ({get_position_display_name(position, short=True)})"
+                    options.append((display_name, position, original_name))
+            
+            self._player_options = sorted(options)
+            # First option wins, matching the order of the sorted scan
+            self._selection_index = {}
+            self._options_by_display = {}
+            for display_name, pos, original_name in self._player_options:
+                self._selection_index.setdefault((display_name.split(' (')[0], pos), original_name)
+                self._options_by_display.setdefault(display_name, (original_name, pos))
+        return self._player_options or []
+    
+    def get_player_options_by_display(self) -> Dict[str, Tuple[str, str]]:
+        """Get the UI display names mapped to (original_name, position), built once with the options"""
+        self.get_player_options_for_ui()
+        return self._options_by_display or {}
     
     def _find_original_player_name(self, normalized_name: str, position: str) -> str:
         """Find the original player name from analyzer data"""
         if not self.team_analyzer:
             return normalized_name
-            
-        original_players = self.team_analyzer.get_our_players_by_position(position)
-        for original in original_players:
-            if normalize_player_name(original) == normalized_name:
-                return original
-        return normalized_name
+        
+        if self._name_reverse is None:
+            # Map normalized names back to the first matching original name, per position
+            self._name_reverse = {}
+            for pos in self.team_analyzer.our_players_stats:
+                originals = self._name_reverse.setdefault(pos, {})
+                for original in self.team_analyzer.get_our_players_by_position(pos):
+                    originals.setdefault(normalize_player_name(original), original)
+        
+        return self._name_reverse.get(position, {}).get(normalized_name, normalized_name)
     
     def get_team_summary_stats(self) -> Dict:
         """Get team-wide summary statistics"""
@@ -79,9 +102,15 @@ class TeamService:
     def validate_player_selection(self, player_display_name: str, position: str) -> Optional[str]:
         """Validate and return the original player name for analysis"""
         player_options = self.get_player_options_for_ui()
+        prefix = player_display_name.split(' (')[0]
+        
+        original_name = (self._selection_index or {}).get((prefix, position))
+        if original_name is not None:
+            return original_name
         
+        # Fall back to a prefix match for partial names
         for display_name, pos, original_name in player_options:
-            if display_name.startswith(player_display_name.split(' (')[0]) and pos == position:
+            if display_name.startswith(prefix) and pos == position:
                 return original_name
         
         return None
@@ -1,35 +1,53 @@
 # UTILS: Predicates and utility functions for data filtering and validation
 """
 Predicates and utility functions to centralize business logic
+
+Predicate factories tag their predicate with a rough `selectivity` (share of values
+expected to pass) so compose_and can run the most discriminating checks first.
 """
-from constants import UNKNOWN_VALUE
+from constants import UNKNOWN_VALUE, WIN_RATE_COL, CS_MIN_COL, VISION_MIN_COL, DMG_MIN_COL
 from utils.utils import normalize_player_name, get_position_display_name
 
 from typing import Any, Callable
+import numpy as np
+import pandas as pd
+
+# streamlit is only needed by the column config and tab helpers, not by CLI code paths
+try:
+    import streamlit as st
+except ImportError:
+    st = None
 
 
 def has_minimum_games(min_games: int = 1) -> Callable:
     """Predicate to check if a player has minimum number of games"""
     def predicate(player_stats) -> bool:
         return player_stats.games_played >= min_games
+    predicate.selectivity = 0.3
     return predicate
 
 def is_position(target_position: str) -> Callable:
     """Predicate to check if a player plays a specific position"""
     def predicate(player_stats) -> bool:
         return player_stats.get_most_played_position() == target_position
+    predicate.selectivity = 0.2
     return predicate
 
 def name_contains(search_term: str) -> Callable:
     """Predicate to check if player name contains search term (case-insensitive)"""
+    # Lowercased once here rather than on every call
+    lowered_term = search_term.lower()
     def predicate(player_name: str) -> bool:
-        return search_term.lower() in player_name.lower()
+        return lowered_term in player_name.lower()
+    # An empty search term matches every name
+    predicate.selectivity = 0.1 if lowered_term else 1.0
     return predicate
 
 def champion_is_known() -> Callable:
     """Predicate to check if champion is not 'Unknown'"""
     def predicate(champion_name: str) -> bool:
         return champion_name != UNKNOWN_VALUE
+    predicate.selectivity = 0.9
     return predicate
 
 def has_sufficient_position_players(min_players: int = 2) -> Callable:
@@ -38,6 +56,36 @@ def has_sufficient_position_players(min_players: int = 2) -> Callable:
         return position_players_count >= min_players
     return predicate
 
+def compose_and(*predicates: Callable) -> Callable:
+    """Combine predicates with a short-circuit AND, most selective (lowest selectivity) first"""
+    # Predicates without an estimate are assumed to let everything through, so they run last
+    ordered = tuple(sorted(predicates, key=lambda predicate: getattr(predicate, 'selectivity', 1.0)))
+    def predicate(value) -> bool:
+        for check in ordered:
+            if not check(value):
+                return False
+        return True
+    predicate.selectivity = min((getattr(check, 'selectivity', 1.0) for check in ordered), default=1.0)
+    return predicate
+
+
+# CSS style of a rank cell, by rank tier
+RANK_STYLES = {
+    "top": 'background-color: #d4edda; color: #155724; font-weight: bold',
+    "bottom": 'background-color: #f8d7da; color: #721c24; font-weight: bold',
+    "middle": 'background-color: #fff3cd; color: #856404; font-weight: bold'
+}
+
+# CSS style of a difference cell, keyed by the first character written by format_difference_emoji
+DIFFERENCE_STYLES = {
+    '📈': 'background-color: #d4edda; color: #155724; font-weight: bold',
+    '📉': 'background-color: #f8d7da; color: #721c24; font-weight: bold',
+    '➡': 'background-color: #e2e3e5; color: #383d41'
+}
+# Text written by format_difference_emoji when there is no average to compare with, and its style
+NOT_AVAILABLE_TEXT = "N/A"
+NOT_AVAILABLE_STYLE = 'color: gray'
+
 
 # Utility functions for formatting and display
 class MetricFormatter:
@@ -62,7 +110,7 @@ class MetricFormatter:
     def format_difference_emoji(player_value: float, avg_value: float) -> str:
         """Format difference with emoji and percentage"""
         if avg_value == 0:
-            return "N/A"
+            return NOT_AVAILABLE_TEXT
         
         diff = player_value - avg_value
         percentage = (diff / avg_value) * 100
@@ -92,62 +140,55 @@ class RankCalculator:
     def get_rank_color_style(rank: int, total: int) -> str:
         """Get CSS style for rank coloring"""
         tier = RankCalculator.get_rank_tier(rank, total)
-        
-        styles = {
-            "top": 'background-color: #d4edda; color: #155724; font-weight: bold',
-            "bottom": 'background-color: #f8d7da; color: #721c24; font-weight: bold',
-            "middle": 'background-color: #fff3cd; color: #856404; font-weight: bold'
-        }
-        
-        return styles.get(tier, '')
+        return RANK_STYLES.get(tier, '')
     
     @staticmethod
     def get_difference_color_style(difference_text: str) -> str:
         """Get CSS style for difference coloring"""
-        if difference_text == "N/A":
-            return 'color: gray'
-        
-        if '📈' in difference_text:
-            return 'background-color: #d4edda; color: #155724; font-weight: bold'
-        elif '📉' in difference_text:
-            return 'background-color: #f8d7da; color: #721c24; font-weight: bold'
-        elif '➡️' in difference_text:
-            return 'background-color: #e2e3e5; color: #383d41'
-        else:
-            return ''
+        if difference_text == NOT_AVAILABLE_TEXT:
+            return NOT_AVAILABLE_STYLE
+        # format_difference_emoji always leads with the marker, so one lookup on it picks the style
+        return DIFFERENCE_STYLES.get(difference_text[:1], '')
 
 
 class DataFrameStyler:
     """Utility class for styling DataFrames consistently"""
     
+    @staticmethod
+    def _difference_column_styles(column: pd.Series) -> pd.Series:
+        """Styles of a whole Difference column, looked up from each cell's leading marker"""
+        text = column.astype(str)
+        styles = text.str[:1].map(DIFFERENCE_STYLES).fillna('')
+        return styles.mask(text == NOT_AVAILABLE_TEXT, NOT_AVAILABLE_STYLE)
+    
+    @staticmethod
+    def _rank_column_styles(column: pd.Series) -> np.ndarray:
+        """Styles of a whole 'rank/total' Rank column, tiered in one vectorized pass"""
+        parts = column.astype(str).str.split('/')
+        rank = pd.to_numeric(parts.str[0], errors='coerce')
+        total = pd.to_numeric(parts.str[1], errors='coerce')
+        # Cells that are not exactly two numbers separated by '/' stay unstyled
+        valid = (parts.str.len() == 2) & rank.notna() & total.notna()
+        styles = np.select(
+            [rank <= total / 3, rank > 2 * total / 3],
+            [RANK_STYLES["top"], RANK_STYLES["bottom"]],
+            default=RANK_STYLES["middle"]
+        )
+        return np.where(valid, styles, '')
+    
     @staticmethod
     def apply_comparison_styling(df):
         """Apply color styling to comparison DataFrames"""
-        def color_difference(val):
-            return RankCalculator.get_difference_color_style(val)
-        
-        def color_rank(val):
-            if '/' not in val:
-                return ''
-            
-            try:
-                rank, total = val.split('/')
-                return RankCalculator.get_rank_color_style(int(rank), int(total))
-            except ValueError:
-                return ''
-        
-        styled_df = df.style.map(color_difference, subset=['Difference'])
-        styled_df = styled_df.map(color_rank, subset=['Rank'])
+        styled_df = df.style.apply(DataFrameStyler._difference_column_styles, subset=['Difference'])
+        styled_df = styled_df.apply(DataFrameStyler._rank_column_styles, subset=['Rank'])
         return styled_df
 
     @staticmethod
     def get_win_rate_column_config():
         """Get column configuration for win rate display"""
-        import streamlit as st
-        from models.multi_game_analyzer import MultiGameAnalyzer
         return {
-            MultiGameAnalyzer.WIN_RATE_COL: st.column_config.NumberColumn(
-                MultiGameAnalyzer.WIN_RATE_COL,
+            WIN_RATE_COL: st.column_config.NumberColumn(
+                WIN_RATE_COL,
                 help="Win rate percentage",
                 format="percent"
             )
@@ -156,7 +197,6 @@ class DataFrameStyler:
     @staticmethod
     def get_comparison_column_config():
         """Get column configuration for comparison tables"""
-        import streamlit as st
         return {
             "Metric": st.column_config.TextColumn("Metric", width="small"),
             "Player Value": st.column_config.TextColumn("Your Value", width="small"),
@@ -172,15 +212,11 @@ class DisplayHelpers:
     @staticmethod
     def get_sort_options():
         """Get available sort options for player rankings"""
-        from models.multi_game_analyzer import MultiGameAnalyzer
-        return [MultiGameAnalyzer.WIN_RATE_COL, 'Avg KDA', 'Games', 
-                MultiGameAnalyzer.DMG_MIN_COL, MultiGameAnalyzer.CS_MIN_COL, 
-                MultiGameAnalyzer.VISION_MIN_COL]
+        return [WIN_RATE_COL, 'Avg KDA', 'Games', DMG_MIN_COL, CS_MIN_COL, VISION_MIN_COL]
 
     @staticmethod
     def create_tabs():
         """Create the main tabs for the global stats application"""
-        import streamlit as st
         return st.tabs(["📋 Player Table", "🎯 Champion Analytics"])
 
     @staticmethod
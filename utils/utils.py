@@ -1,65 +1,110 @@
+import sys
+import unicodedata
+import weakref
+from functools import lru_cache
 from constants import POSITION_FULL_NAMES, POSITION_SHORT_NAMES
 
 
 def fix_encoding(text):
     """Fix encoding issues in text (convert from Latin-1 to UTF-8)"""
-    if not isinstance(text, str):
+    # Non-strings bypass the cache (they may be unhashable) and ASCII text never needs repair
+    if not isinstance(text, str) or text.isascii():
         return text
+    return _fix_encoding_cached(text)
+
+
+@lru_cache(maxsize=4096)
+def _fix_encoding_cached(text):
+    """Cached Latin-1 / Windows-1252 to UTF-8 repair of a non-ASCII string"""
+    # Text with characters beyond Latin-1 cannot be Latin-1 mojibake, so skip the raising encode
+    if max(text) <= '\xff':
+        try:
+            return text.encode('latin-1').decode('utf-8')
+        except UnicodeDecodeError:
+            pass
     try:
-        return text.encode('latin-1').decode('utf-8')
+        return text.encode('windows-1252').decode('utf-8')
     except (UnicodeDecodeError, UnicodeEncodeError):
-        try:
-            return text.encode('windows-1252').decode('utf-8')
-        except (UnicodeDecodeError, UnicodeEncodeError):
-            return text
+        return text
 
 
 def normalize_player_name(name):
     """Normalize player name for consistent storage and comparison"""
     if not isinstance(name, str):
         return name
+    return _normalize_player_name_cached(name)
 
+
+def normalize_player_names(names):
+    """Normalize a batch of player names (non-string entries are passed through unchanged)"""
+    # Bind the cached core once instead of going through the per-name wrapper
+    cached = _normalize_player_name_cached
+    return [cached(name) if isinstance(name, str) else name for name in names]
+
+
+@lru_cache(maxsize=2048)
+def _normalize_player_name_cached(name):
+    """Cached NFC normalization and interning of a player name string"""
     fixed_name = fix_encoding(name)
 
-    import unicodedata
     normalized_name = unicodedata.normalize('NFC', fixed_name)
     
-    return normalized_name
+    # Interned so set/dict lookups on normalized names short-circuit on identity
+    return sys.intern(normalized_name)
 
 
 def normalize_position(position_raw):
     """Normalize position name to standard format (SUPPORT instead of UTILITY)"""
     if not isinstance(position_raw, str):
         return position_raw
-    
-    # Convert to uppercase for consistency
-    position_upper = position_raw.upper().strip()
+    return _normalize_position_cached(position_raw)
+
+
+@lru_cache(maxsize=2048)
+def _normalize_position_cached(position_raw, _full_names=POSITION_FULL_NAMES):
+    """Cached mapping of a raw position string to its standard name"""
+    # Convert to uppercase for consistency (stripped first, so less text is uppercased)
+    position_upper = position_raw.strip().upper()
     
     # Use the mapping from constants to convert UTILITY -> SUPPORT
-    return POSITION_FULL_NAMES.get(position_upper, position_upper)
+    return sys.intern(_full_names.get(position_upper, position_upper))
 
 
 def get_position_display_name(position, short=False):
     """Get display name for position (short or full format)"""
     if not isinstance(position, str):
         return position
-    
+    return _position_display_name_cached(position, short)
+
+
+@lru_cache(maxsize=512)
+def _position_display_name_cached(position, short, _short_names=POSITION_SHORT_NAMES):
+    """Cached short or full display name of a raw position string"""
     # First normalize the position
-    normalized_position = normalize_position(position)
+    normalized_position = _normalize_position_cached(position)
     
     if short:
-        return POSITION_SHORT_NAMES.get(normalized_position, normalized_position)
+        return _short_names.get(normalized_position, normalized_position)
     else:
         return normalized_position
 
 
+# Team summaries per analyzer, with the games_analyzed count they were built from
+_team_summary_cache = weakref.WeakKeyDictionary()
+
+
 def get_team_players_summary(team_analyzer):
     """Get a summary of all team players with their primary positions"""
-    team_players = {}
-    
-    for position in ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "SUPPORT"]:
-        players = team_analyzer.get_our_players_by_position(position)
-        if players:
-            team_players[position] = [normalize_player_name(player) for player in players]
+    cached = _team_summary_cache.get(team_analyzer)
+    if cached is None or cached[0] != team_analyzer.games_analyzed:
+        # One call for every played position, already in POSITIONS order and without empty positions
+        team_players = {
+            position: normalize_player_names(players)
+            for position, players in team_analyzer.get_players_by_position_map().items()
+        }
+        
+        cached = (team_analyzer.games_analyzed, team_players)
+        _team_summary_cache[team_analyzer] = cached
     
-    return team_players
\ No newline at end of file
+    # Copies of the lists, so callers can't alter the cached summary
+    return {position: list(players) for position, players in cached[1].items()}
\ No newline at end of file
@@ -1,216 +1,332 @@
 # VIEW: Team comparison visualizations and chart generation
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
 from models.team_analyzer import TeamAnalyzer
 from models.position_comparison import PositionComparison
 from utils.utils import fix_encoding
 
+# Stand-in for a statistic without a comparison difference
+_NO_DIFFERENCE = {'percentage_diff': 0}
+
+# Statistics shown on the radar chart, in axis order
+RADAR_STATS = (
+    ('damage', 'Damage'),
+    ('kda', 'KDA'),
+    ('cs_per_minute', 'CS/min'),
+    ('vision_per_minute', 'Vision/min'),
+    ('damage_per_gold', 'Damage/Gold')
+)
+_RADAR_KEYS = [stat_key for stat_key, _ in RADAR_STATS]
+_RADAR_CATEGORIES = [stat_display for _, stat_display in RADAR_STATS]
+# Radar axis angles, with the first angle repeated to close the polygon
+_RADAR_ANGLES = np.append(np.linspace(0, 2 * np.pi, len(RADAR_STATS), endpoint=False), 0.0)
+
+
+def _close_polygon(values: np.ndarray) -> np.ndarray:
+    """Radar values with the first value repeated at the end to close the polygon"""
+    closed = np.empty(len(values) + 1)
+    closed[:-1] = values
+    closed[-1] = values[0]
+    return closed
+
+
+def _sign_colors(values: Sequence[float], positive: str, negative: str) -> np.ndarray:
+    """Bar colors by sign of the values (zero counts as negative)"""
+    return np.where(np.asarray(values) > 0, positive, negative)
+
+
+def _draw_position_radar(payload: Dict) -> Figure:
+    """Draw the radar chart of a player vs opponents from its precomputed payload"""
+    # Values already close the polygon, like the precomputed angles
+    player_values = payload['player_values']
+    opponent_values = payload['opponent_values']
+    angles = _RADAR_ANGLES
+
+    fig = plt.figure(figsize=(10, 10))
+    ax = fig.add_subplot(projection='polar')
+    # Plot lines
+    ax.plot(angles, player_values, 'o-', linewidth=2, label=payload['player_label'], color='blue')
+    ax.fill(angles, player_values, alpha=0.25, color='blue')
+
+    ax.plot(angles, opponent_values, 'o-', linewidth=2, label='Opponents (average)', color='red')
+    ax.fill(angles, opponent_values, alpha=0.25, color='red')
+
+    # Customize chart
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(_RADAR_CATEGORIES)
+    ax.set_ylim(0, 100)
+    ax.set_yticks([20, 40, 60, 80, 100])
+    ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'])
+    ax.grid(True)
+
+    ax.legend(loc='upper right', bbox_to_anchor=(1.1, 1.1))
+    ax.set_title(f"Comparison: {payload['player_label']} ({payload['position']}) vs Opponents",
+                 size=16, fontweight='bold', pad=20)
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_team_overview(payload: Dict) -> Figure:
+    """Draw the best players by position bar chart from its precomputed payload"""
+    positions = payload['positions']
+    players = payload['players']
+    damage_diffs = payload['damage_diffs']
+    kda_diffs = payload['kda_diffs']
+
+    # Create chart
+    x = np.arange(len(positions))
+    width = 0.35
+
+    fig = plt.figure(figsize=(12, 8))
+    ax = fig.add_subplot()
+
+    # Bars for damage
+    bars1 = ax.bar(x - width/2, damage_diffs, width, label='Damage Difference (%)',
+                  color=_sign_colors(damage_diffs, 'green', 'red'), alpha=0.7)
+
+    # Bars for KDA
+    bars2 = ax.bar(x + width/2, kda_diffs, width, label='KDA Difference (%)',
+                  color=_sign_colors(kda_diffs, 'lightgreen', 'lightcoral'), alpha=0.7)
+
+    # Customize chart
+    ax.set_xlabel('Position')
+    ax.set_ylabel('Difference in % vs Opponents')
+    ax.set_title('Performance of our best players by position vs Opponents')
+    ax.set_xticks(x)
+    ax.set_xticklabels([f"{pos}\n({player})" for pos, player in zip(positions, players)])
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+
+    # Add values on bars (bar_label puts negative values under their bar)
+    ax.bar_label(bars1, fmt='%.1f%%', padding=3)
+    ax.bar_label(bars2, fmt='%.1f%%', padding=3)
+
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    fig.tight_layout()
+    return fig
+
+
+def _draw_position_players(payload: Dict) -> Figure:
+    """Draw the all players at a position bar chart from its precomputed payload"""
+    player_names = payload['player_names']
+    damage_diffs = payload['damage_diffs']
+    kda_diffs = payload['kda_diffs']
+
+    # Create chart
+    x = np.arange(len(player_names))
+    width = 0.35
+
+    fig = plt.figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+
+    bars1 = ax.bar(x - width/2, damage_diffs, width, label='Damage Difference (%)',
+                  color=_sign_colors(damage_diffs, 'green', 'red'), alpha=0.7)
+
+    bars2 = ax.bar(x + width/2, kda_diffs, width, label='KDA Difference (%)',
+                  color=_sign_colors(kda_diffs, 'lightgreen', 'lightcoral'), alpha=0.7)
+
+    ax.set_xlabel('Players')
+    ax.set_ylabel('Difference in % vs Opponents')
+    ax.set_title(f"All our {payload['position']} players vs Opponents")
+    ax.set_xticks(x)
+    ax.set_xticklabels(player_names, rotation=45, ha='right')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+
+    fig.tight_layout()
+    return fig
+
+
+def _draw_detailed_comparison(payload: Dict) -> Figure:
+    """Draw the detailed normalized and percentage comparison charts from their precomputed payload"""
+    stat_names = payload['stat_names']
+    player_values = payload['player_values']
+    opponent_values = payload['opponent_values']
+    raw_player_values = payload['raw_player_values']
+    raw_opponent_values = payload['raw_opponent_values']
+    percentage_diffs = payload['percentage_diffs']
+    player_label = payload['player_label']
+
+    # Create chart with subplots
+    fig = plt.figure(figsize=(15, 6))
+    ax1, ax2 = fig.subplots(1, 2)
+
+    # Chart 1: Normalized values (0-100 scale)
+    x = np.arange(len(stat_names))
+    width = 0.35
+    bars1 = ax1.bar(x - width/2, player_values, width, label=player_label, color='blue', alpha=0.7)
+    bars2 = ax1.bar(x + width/2, opponent_values, width, label='Opponents', color='red', alpha=0.7)
+
+    # Add raw values as text on bars
+    ax1.bar_label(bars1, labels=[f'{value:.1f}' for value in raw_player_values], padding=3, fontsize=8)
+    ax1.bar_label(bars2, labels=[f'{value:.1f}' for value in raw_opponent_values], padding=3, fontsize=8)
+
+    ax1.set_xlabel('Statistics')
+    ax1.set_ylabel('Normalized Values (0-100)')
+    ax1.set_title(f'Normalized comparison: {player_label} vs Opponents\n(Raw values shown on bars)')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(stat_names, rotation=45, ha='right')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    ax1.set_ylim(0, 110)  # Give some space for text annotations
+
+    # Chart 2: Percentage differences
+    colors = _sign_colors(percentage_diffs, 'green', 'red')
+    bars = ax2.bar(x, percentage_diffs, color=colors, alpha=0.7)
+
+    ax2.set_xlabel('Statistics')
+    ax2.set_ylabel('Difference in %')
+    ax2.set_title('Percentage differences')
+    ax2.set_xticks(x)
+    ax2.set_xticklabels(stat_names, rotation=45, ha='right')
+    ax2.grid(True, alpha=0.3)
+    ax2.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+
+    # Add values on bars
+    ax2.bar_label(bars, labels=[f'{diff:.1f}%' for diff in percentage_diffs], padding=3)
+
+    fig.tight_layout()
+    return fig
+
+
+# Chart kind -> drawing function
+_DRAWERS = {
+    'radar': _draw_position_radar,
+    'team_overview': _draw_team_overview,
+    'position_players': _draw_position_players,
+    'detailed': _draw_detailed_comparison
+}
+
+
 class TeamVisualizer:
     """Class for creating team comparison visualizations"""
     
     def __init__(self, team_analyzer: TeamAnalyzer):
         self.team_analyzer = team_analyzer
         self.position_comparison = PositionComparison(team_analyzer, None)
+        self._players_by_position = None
+        self._display_names = {}
     
-    def plot_position_comparison_radar(self, player_name: str, position: str):
-        """Creates a radar chart comparing a player to opponents"""
+    def invalidate(self):
+        """Drop cached comparisons and player listings (call after the analyzer reloads its games)"""
+        # compare_player_to_opponents is memoized per (player, position) by PositionComparison
+        self.position_comparison.invalidate_cache()
+        self._players_by_position = None
+        self._display_names = {}
+    
+    def _get_players_by_position(self) -> Dict:
+        """Position -> players map, read from the loaded analyzer once and reused by every plot"""
+        if self._players_by_position is None:
+            self._players_by_position = self.team_analyzer.get_players_by_position_map()
+            self._display_names = {
+                player: fix_encoding(player) for players in self._players_by_position.values() for player in players
+            }
+        return self._players_by_position
+    
+    def _display_name(self, player_name: str) -> str:
+        """Encoding-fixed display name of a player, precomputed with the position map"""
+        self._get_players_by_position()
+        return self._display_names.get(player_name) or fix_encoding(player_name)
+    
+    def _get_player_comparison(self, player_name: str, position: str) -> Optional[Dict]:
+        """Get a player's comparison with opponents, reporting when the player has no data at that position"""
         comparison = self.position_comparison.compare_player_to_opponents(player_name, position)
-        
         if not comparison:
             print(f"No data available for {player_name} in position {position}")
-            return
-        
-        # Statistics to display on the radar
-        stats_to_plot = [
-            ('damage', 'Damage'),
-            ('kda', 'KDA'),
-            ('cs_per_minute', 'CS/min'),
-            ('vision_per_minute', 'Vision/min'),
-            ('damage_per_gold', 'Damage/Gold')
-        ]
+        return comparison
+    
+    @staticmethod
+    def _stat_array(stats: Dict, keys: List[str]) -> np.ndarray:
+        """Values of the given statistics as a float array"""
+        return np.fromiter((stats[key] for key in keys), dtype=np.float64, count=len(keys))
+    
+    @staticmethod
+    def _normalize_to_max(player_values: np.ndarray, opponent_values: np.ndarray):
+        """Scale each player/opponent pair to a percentage of the larger of the two (0 when both are <= 0)"""
+        max_values = np.maximum(player_values, opponent_values)
+        scale = np.divide(100.0, max_values, out=np.zeros_like(max_values), where=max_values > 0)
+        return player_values * scale, opponent_values * scale
+    
+    @classmethod
+    def _normalize_and_diff(cls, player_values: np.ndarray, opponent_values: np.ndarray):
+        """Normalized player/opponent values and the player's % difference (0 when the opponent value is <= 0)"""
+        normalized_player, normalized_opponent = cls._normalize_to_max(player_values, opponent_values)
+        percentage_diffs = np.divide(
+            player_values - opponent_values, opponent_values, out=np.zeros_like(player_values), where=opponent_values > 0
+        ) * 100
+        return normalized_player, normalized_opponent, percentage_diffs
+    
+    def _radar_payload(self, player_name: str, position: str) -> Optional[Dict]:
+        """Numbers and labels of a player's radar chart"""
+        comparison = self._get_player_comparison(player_name, position)
+        if not comparison:
+            return None
         
         # Prepare data
-        categories = [stat_display for _, stat_display in stats_to_plot]
-        player_values = []
-        opponent_values = []
-        
-        for stat_key, _ in stats_to_plot:
-            player_val = comparison['player_stats'][stat_key]
-            opponent_val = comparison['opponents_stats'][stat_key]
-            
-            # Normalize values (percentage of maximum)
-            max_val = max(player_val, opponent_val)
-            if max_val > 0:
-                player_values.append((player_val / max_val) * 100)
-                opponent_values.append((opponent_val / max_val) * 100)
-            else:
-                player_values.append(0)
-                opponent_values.append(0)
-        
-        # Create radar chart
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-        
-        # Close the polygon
-        player_values += player_values[:1]
-        opponent_values += opponent_values[:1]
-        angles += angles[:1]
-        
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
-          # Plot lines
-        ax.plot(angles, player_values, 'o-', linewidth=2, label=fix_encoding(player_name), color='blue')
-        ax.fill(angles, player_values, alpha=0.25, color='blue')
-        
-        ax.plot(angles, opponent_values, 'o-', linewidth=2, label='Opponents (average)', color='red')
-        ax.fill(angles, opponent_values, alpha=0.25, color='red')
-        
-        # Customize chart
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories)
-        ax.set_ylim(0, 100)
-        ax.set_yticks([20, 40, 60, 80, 100])
-        ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'])
-        ax.grid(True)
-        
-        plt.legend(loc='upper right', bbox_to_anchor=(1.1, 1.1))
-        plt.title(f'Comparison: {fix_encoding(player_name)} ({position}) vs Opponents', 
-                 size=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        plt.show()
+        player_values, opponent_values = self._normalize_to_max(
+            self._stat_array(comparison['player_stats'], _RADAR_KEYS),
+            self._stat_array(comparison['opponents_stats'], _RADAR_KEYS)
+        )
+        return {
+            'player_values': _close_polygon(player_values),
+            'opponent_values': _close_polygon(opponent_values),
+            'player_label': fix_encoding(player_name),
+            'position': position
+        }
     
-    def plot_team_performance_overview(self):
-        """Creates a bar chart comparing all our players to opponents"""
-        best_performers = self.position_comparison.get_best_performers_by_position()
+    def _team_overview_payload(self) -> Optional[Dict]:
+        """Numbers and labels of the best players by position chart"""
+        best_performers = self.position_comparison.get_best_performers_with_diffs()
         
-        positions = []
-        players = []
-        damage_diffs = []
-        kda_diffs = []
-        for position, performers in best_performers.items():
-            if performers:
-                best_player, damage_diff = performers[0]
-                positions.append(position)
-                players.append(fix_encoding(best_player))
-                damage_diffs.append(damage_diff)
-                
-                # Get KDA difference for this player
-                comparison = self.position_comparison.compare_player_to_opponents(best_player, position)
-                if comparison and 'kda' in comparison['differences']:
-                    kda_diffs.append(comparison['differences']['kda']['percentage_diff'])
-                else:
-                    kda_diffs.append(0)
-        
-        if not positions:
+        if best_performers.empty:
             print("No data to display")
-            return
-        
-        # Create chart
-        x = np.arange(len(positions))
-        width = 0.35
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Bars for damage
-        bars1 = ax.bar(x - width/2, damage_diffs, width, label='Damage Difference (%)', 
-                      color=['green' if d > 0 else 'red' for d in damage_diffs], alpha=0.7)
-        
-        # Bars for KDA
-        bars2 = ax.bar(x + width/2, kda_diffs, width, label='KDA Difference (%)', 
-                      color=['lightgreen' if d > 0 else 'lightcoral' for d in kda_diffs], alpha=0.7)
-        
-        # Customize chart
-        ax.set_xlabel('Position')
-        ax.set_ylabel('Difference in % vs Opponents')
-        ax.set_title('Performance of our best players by position vs Opponents')
-        ax.set_xticks(x)
-        ax.set_xticklabels([f"{pos}\n({player})" for pos, player in zip(positions, players)])
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-        
-        # Add values on bars
-        for bar in bars1:
-            height = bar.get_height()
-            ax.annotate(f'{height:.1f}%',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3 if height >= 0 else -15),
-                       textcoords="offset points",
-                       ha='center', va='bottom' if height >= 0 else 'top')
-        
-        for bar in bars2:
-            height = bar.get_height()
-            ax.annotate(f'{height:.1f}%',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3 if height >= 0 else -15),
-                       textcoords="offset points",
-                       ha='center', va='bottom' if height >= 0 else 'top')
-        
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.show()
+            return None
+        
+        return {
+            'positions': best_performers['position'].tolist(),
+            'players': [self._display_name(player) for player in best_performers['player']],
+            'damage_diffs': best_performers['damage_diff'].to_numpy(),
+            'kda_diffs': best_performers['kda_diff'].to_numpy()
+        }
     
-    def plot_all_players_at_position(self, position: str):
-        """Compare all our players at a given position"""
-        our_players = self.team_analyzer.get_our_players_by_position(position)
+    def _position_players_payload(self, position: str) -> Optional[Dict]:
+        """Numbers and labels of the all players at a position chart"""
+        our_players = self._get_players_by_position().get(position, ())
         
         if not our_players:
             print(f"No players found in position {position}")
-            return
+            return None
         
         player_names = []
         damage_diffs = []
         kda_diffs = []
+        compare = self.position_comparison.compare_player_to_opponents
         for player in our_players:
-            comparison = self.position_comparison.compare_player_to_opponents(player, position)
-            if comparison:
-                player_names.append(fix_encoding(player))
-                
-                if 'damage' in comparison['differences']:
-                    damage_diffs.append(comparison['differences']['damage']['percentage_diff'])
-                else:
-                    damage_diffs.append(0)
-                
-                if 'kda' in comparison['differences']:
-                    kda_diffs.append(comparison['differences']['kda']['percentage_diff'])
-                else:
-                    kda_diffs.append(0)
+            comparison = compare(player, position)
+            if not comparison:
+                continue
+            differences = comparison['differences']
+            player_names.append(self._display_name(player))
+            # Statistics missing from the differences count as a 0% difference
+            damage_diffs.append(differences.get('damage', _NO_DIFFERENCE)['percentage_diff'])
+            kda_diffs.append(differences.get('kda', _NO_DIFFERENCE)['percentage_diff'])
         
         if not player_names:
             print(f"No comparison data for position {position}")
-            return
-        
-        # Create chart
-        x = np.arange(len(player_names))
-        width = 0.35
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        bars1 = ax.bar(x - width/2, damage_diffs, width, label='Damage Difference (%)', 
-                      color=['green' if d > 0 else 'red' for d in damage_diffs], alpha=0.7)
+            return None
         
-        bars2 = ax.bar(x + width/2, kda_diffs, width, label='KDA Difference (%)', 
-                      color=['lightgreen' if d > 0 else 'lightcoral' for d in kda_diffs], alpha=0.7)
-        
-        ax.set_xlabel('Players')
-        ax.set_ylabel('Difference in % vs Opponents')
-        ax.set_title(f'All our {position} players vs Opponents')
-        ax.set_xticks(x)
-        ax.set_xticklabels(player_names, rotation=45, ha='right')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-        
-        plt.tight_layout()
-        plt.show()
+        return {'player_names': player_names, 'damage_diffs': damage_diffs, 'kda_diffs': kda_diffs, 'position': position}
     
-    def plot_detailed_comparison(self, player_name: str, position: str):
-        """Detailed chart with all statistics"""
-        comparison = self.position_comparison.compare_player_to_opponents(player_name, position)
-        
+    def _detailed_payload(self, player_name: str, position: str) -> Optional[Dict]:
+        """Numbers and labels of a player's detailed comparison charts"""
+        comparison = self._get_player_comparison(player_name, position)
         if not comparison:
-            print(f"No data available for {player_name} in position {position}")
-            return
+            return None
         
         # All available statistics
         all_stats = [
@@ -224,93 +340,60 @@ class TeamVisualizer:
             ('assists', 'Assists')
         ]
         # Prepare data
-        stat_names = []
-        player_values = []
-        opponent_values = []
-        raw_player_values = []
-        raw_opponent_values = []
-        
-        for stat_key, stat_display in all_stats:
-            if stat_key in comparison['player_stats'] and stat_key in comparison['opponents_stats']:
-                stat_names.append(stat_display)
-                player_val = comparison['player_stats'][stat_key]
-                opponent_val = comparison['opponents_stats'][stat_key]
-                
-                raw_player_values.append(player_val)
-                raw_opponent_values.append(opponent_val)
-                
-                # Normalize values to 0-100 scale based on max value for this stat
-                max_val = max(player_val, opponent_val)
-                if max_val > 0:
-                    player_values.append((player_val / max_val) * 100)
-                    opponent_values.append((opponent_val / max_val) * 100)
-                else:
-                    player_values.append(0)
-                    opponent_values.append(0)
-        
-        # Create chart with subplots
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        # Chart 1: Normalized values (0-100 scale)
-        x = np.arange(len(stat_names))
-        width = 0.35
-        bars1 = ax1.bar(x - width/2, player_values, width, label=fix_encoding(player_name), color='blue', alpha=0.7)
-        bars2 = ax1.bar(x + width/2, opponent_values, width, label='Opponents', color='red', alpha=0.7)
-        
-        # Add raw values as text on bars
-        for i, (bar1, bar2) in enumerate(zip(bars1, bars2)):
-            # Player bar
-            height1 = bar1.get_height()
-            ax1.annotate(f'{raw_player_values[i]:.1f}',
-                        xy=(bar1.get_x() + bar1.get_width() / 2, height1),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom', fontsize=8)
-            
-            # Opponent bar
-            height2 = bar2.get_height()
-            ax1.annotate(f'{raw_opponent_values[i]:.1f}',
-                        xy=(bar2.get_x() + bar2.get_width() / 2, height2),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha='center', va='bottom', fontsize=8)
-        
-        ax1.set_xlabel('Statistics')
-        ax1.set_ylabel('Normalized Values (0-100)')
-        ax1.set_title(f'Normalized comparison: {fix_encoding(player_name)} vs Opponents\n(Raw values shown on bars)')
-        ax1.set_xticks(x)
-        ax1.set_xticklabels(stat_names, rotation=45, ha='right')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        ax1.set_ylim(0, 110)  # Give some space for text annotations
-        
-        # Chart 2: Percentage differences
-        percentage_diffs = []
-        for stat_key, _ in all_stats:
-            if stat_key in comparison['differences']:
-                percentage_diffs.append(comparison['differences'][stat_key]['percentage_diff'])
-            else:
-                percentage_diffs.append(0)
-        
-        colors = ['green' if d > 0 else 'red' for d in percentage_diffs]
-        bars = ax2.bar(x, percentage_diffs, color=colors, alpha=0.7)
-        
-        ax2.set_xlabel('Statistics')
-        ax2.set_ylabel('Difference in %')
-        ax2.set_title('Percentage differences')
-        ax2.set_xticks(x)
-        ax2.set_xticklabels(stat_names, rotation=45, ha='right')
-        ax2.grid(True, alpha=0.3)
-        ax2.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-        
-        # Add values on bars
-        for bar, diff in zip(bars, percentage_diffs):
-            height = bar.get_height()
-            ax2.annotate(f'{diff:.1f}%',
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3 if height >= 0 else -15),
-                        textcoords="offset points",
-                        ha='center', va='bottom' if height >= 0 else 'top')
-        
-        plt.tight_layout()
-        plt.show()
+        player_stats = comparison['player_stats']
+        opponents_stats = comparison['opponents_stats']
+        shown_stats = [
+            (stat_key, stat_display) for stat_key, stat_display in all_stats
+            if stat_key in player_stats and stat_key in opponents_stats
+        ]
+        keys = [stat_key for stat_key, _ in shown_stats]
+        raw_player_values = self._stat_array(player_stats, keys)
+        raw_opponent_values = self._stat_array(opponents_stats, keys)
+        
+        # Normalize values to 0-100 scale based on max value for this stat, with the differences in the same pass
+        player_values, opponent_values, percentage_diffs = self._normalize_and_diff(
+            raw_player_values, raw_opponent_values
+        )
+        
+        return {
+            'stat_names': [stat_display for _, stat_display in shown_stats],
+            'player_values': player_values,
+            'opponent_values': opponent_values,
+            'raw_player_values': raw_player_values,
+            'raw_opponent_values': raw_opponent_values,
+            'percentage_diffs': percentage_diffs,
+            'player_label': fix_encoding(player_name)
+        }
+    
+    def _payload(self, kind: str, args: Sequence) -> Optional[Dict]:
+        """Build the payload of a chart kind from its plot arguments"""
+        builders = {
+            'radar': self._radar_payload,
+            'team_overview': self._team_overview_payload,
+            'position_players': self._position_players_payload,
+            'detailed': self._detailed_payload
+        }
+        return builders[kind](*args)
+    
+    def _plot(self, kind: str, *args) -> Optional[Figure]:
+        """Draw a chart on a new figure owned by the caller, who closes it (e.g. plt.close after st.pyplot); None without data"""
+        payload = self._payload(kind, args)
+        if payload is None:
+            return None
+        return _DRAWERS[kind](payload)
+    
+    def plot_position_comparison_radar(self, player_name: str, position: str) -> Optional[Figure]:
+        """Creates a radar chart comparing a player to opponents"""
+        return self._plot('radar', player_name, position)
+    
+    def plot_team_performance_overview(self) -> Optional[Figure]:
+        """Creates a bar chart comparing all our players to opponents"""
+        return self._plot('team_overview')
+    
+    def plot_all_players_at_position(self, position: str) -> Optional[Figure]:
+        """Compare all our players at a given position"""
+        return self._plot('position_players', position)
+    
+    def plot_detailed_comparison(self, player_name: str, position: str) -> Optional[Figure]:
+        """Detailed chart with all statistics"""
+        return self._plot('detailed', player_name, position)
@@ -4,15 +4,24 @@ Reusable UI components for the Streamlit interface
 """
 
 from .game_card import display_game_card, display_game_cards_grid
-from .player_card import display_player_card, display_player_cards_grid, display_participants_cards_grid, display_player_search_results
+from .player_card import display_player_card, display_player_cards_grid, display_player_table, display_participants_cards_grid, display_player_search_results
 from .navigation import create_navigation
+from .data_loaders import load_multi_game_analyzer, load_games_data
+from .player_stats import display_summary_metrics, display_detailed_metrics, display_position_comparison, display_champions_table
 
 __all__ = [
     'display_game_card',
     'display_game_cards_grid', 
     'display_player_card',
     'display_player_cards_grid',
+    'display_player_table',
     'display_participants_cards_grid',
     'display_player_search_results',
-    'create_navigation'
+    'create_navigation',
+    'load_multi_game_analyzer',
+    'load_games_data',
+    'display_summary_metrics',
+    'display_detailed_metrics',
+    'display_position_comparison',
+    'display_champions_table'
 ]
@@ -0,0 +1,36 @@
+"""
+Shared cached data loaders for Streamlit pages
+"""
+import os
+import streamlit as st
+from models.multi_game_analyzer import MultiGameAnalyzer
+from constants import DATA_DIR
+
+
+@st.cache_resource(show_spinner="Loading and analyzing all games...")
+def load_multi_game_analyzer():
+    """Load the multi-game analyzer once per process, shared by every session"""
+    analyzer = MultiGameAnalyzer(DATA_DIR)
+    analyzer.load_all_games()
+    return analyzer
+
+
+def _data_dir_signature():
+    """Names and modification times of the game files, used as a cache key"""
+    if not os.path.exists(DATA_DIR):
+        return ()
+    with os.scandir(DATA_DIR) as entries:
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.name.endswith('.json')
+        ))
+
+
+@st.cache_data(show_spinner=False)
+def _load_games_data(signature):
+    """Cached games list for a given data directory signature"""
+    return MultiGameAnalyzer(DATA_DIR).get_all_games_data()
+
+
+def load_games_data():
+    """Get all games data, re-read only when a game file is added, removed or modified"""
+    return _load_games_data(_data_dir_signature())
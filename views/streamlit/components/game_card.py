@@ -3,46 +3,66 @@
 Reusable game card component for displaying game information
 """
 
+import os
+import re
+from itertools import zip_longest
 import streamlit as st
-import pandas as pd
 from utils.utils import fix_encoding
 from constants import TEAM_1_SIMPLE, TEAM_2_SIMPLE, TEAM_1_EMOJI, TEAM_2_EMOJI, WIN_EMOJI, PAGES
 
+# Characters that would otherwise be read as markdown (or break table cells) in player names
+_MARKDOWN_SPECIAL = re.compile(r'([\\`*_{}\[\]<>|#])')
 
-def display_game_card(game_summary: dict, analyzer=None):
+
+def _markdown_cell(text: str) -> str:
+    """Escape a value for use as a markdown table cell"""
+    return _MARKDOWN_SPECIAL.sub(r'\\\1', text)
+
+
+def _team_table_markdown(game_summary: dict) -> str:
+    """Markdown table of both teams' players and champions, one team per column"""
+    # Prepare team data for table
+    team1_display = [
+        _markdown_cell(fix_encoding(player_champion))
+        for player_champion in game_summary['team1_players_with_champions']
+    ]
+    team2_display = [
+        _markdown_cell(fix_encoding(player_champion))
+        for player_champion in game_summary['team2_players_with_champions']
+    ]
+    
+    team1_label = f"{TEAM_1_EMOJI} {TEAM_1_SIMPLE} {WIN_EMOJI if game_summary['winning_team'] == 1 else ''}"
+    team2_label = f"{TEAM_2_EMOJI} {TEAM_2_SIMPLE} {WIN_EMOJI if game_summary['winning_team'] == 2 else ''}"
+    lines = [f"| {team1_label} | {team2_label} |", "| --- | --- |"]
+    # Fill the shorter team with empty cells
+    lines.extend(
+        f"| {player1} | {player2} |" for player1, player2 in zip_longest(team1_display, team2_display, fillvalue="")
+    )
+    return "\n".join(lines)
+
+
+def _file_mtime(file_path: str):
+    """Modification time of a game file (None when it cannot be read)"""
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _game_summary(_analyzer, _game_info: dict, file_path: str, mtime) -> dict:
+    """Display summary of a game, cached per game file and modification time (underscored arguments are not hashed)"""
+    return _analyzer.get_game_summary_for_display(_game_info)
+
+
+def display_game_card(game_summary: dict, analyzer=None, team_table: str = None):
     analyze_clicked = False
     
     with st.container(border=True):
         st.markdown(f"**{game_summary['date_string']}** • {game_summary['duration']}")
         
-        # Prepare team data for table
-        max_players = max(
-            len(game_summary['team1_players_with_champions']), 
-            len(game_summary['team2_players_with_champions'])
-        )
-        
-        # Fill shorter team with empty strings
-        team1_display = [
-            fix_encoding(player_champion) 
-            for player_champion in game_summary['team1_players_with_champions']
-        ]
-        team2_display = [
-            fix_encoding(player_champion) 
-            for player_champion in game_summary['team2_players_with_champions']
-        ]
-        
-        while len(team1_display) < max_players:
-            team1_display.append("")
-        while len(team2_display) < max_players:
-            team2_display.append("")
-        
-        # Create DataFrame
-        team_data = pd.DataFrame({
-            f"{TEAM_1_EMOJI} {TEAM_1_SIMPLE} {WIN_EMOJI if game_summary['winning_team'] == 1 else ''}": team1_display,
-            f"{TEAM_2_EMOJI} {TEAM_2_SIMPLE} {WIN_EMOJI if game_summary['winning_team'] == 2 else ''}": team2_display
-        })
-        
-        st.dataframe(team_data, hide_index=True, use_container_width=True)
+        # A plain markdown table is much lighter to send and lay out than an interactive dataframe per card
+        st.markdown(team_table if team_table is not None else _team_table_markdown(game_summary))
         
         # Button to view detailed game analysis (if analyzer provided)
         if analyzer:
@@ -55,10 +75,16 @@ def display_game_card(game_summary: dict, analyzer=None):
 
 
 def display_game_cards_grid(games_data: list, analyzer, cols_per_row: int = 2):
-    for i in range(0, len(games_data), cols_per_row):
+    # Summaries and team tables of every game are prepared in one pass before any card is drawn
+    game_summaries = [
+        _game_summary(analyzer, game_info, game_info['file_path'], _file_mtime(game_info['file_path']))
+        for game_info in games_data
+    ]
+    team_tables = [_team_table_markdown(game_summary) for game_summary in game_summaries]
+    
+    for i in range(0, len(game_summaries), cols_per_row):
         cols = st.columns(cols_per_row)
         
-        for j, game_info in enumerate(games_data[i:i+cols_per_row]):
+        for j, game_summary in enumerate(game_summaries[i:i+cols_per_row]):
             with cols[j]:
-                game_summary = analyzer.get_game_summary_for_display(game_info)
-                display_game_card(game_summary, analyzer)
+                display_game_card(game_summary, analyzer, team_tables[i + j])
@@ -2,32 +2,34 @@
 Shared navigation component for Streamlit pages
 """
 import streamlit as st
+from constants import PAGES
+
+# Page name -> (navigation label, page file), in navigation order
+NAVIGATION_PAGES = {
+    "Home": ("🏠 Home", PAGES['HOME']),
+    "Single Game": ("📊 Single Game", PAGES['SINGLE_GAME']),
+    "Global Stats": ("🌌 Global Stats", PAGES['GLOBAL_STATS']),
+    "Marmotte Flip": ("🦦 Marmotte Flip", PAGES['MARMOTTE_FLIP'])
+}
+_PAGE_NAMES = list(NAVIGATION_PAGES)
 
 def create_navigation(current_page="Home"):
-    col1, col2, col3, col4, col5 = st.columns([1, 2, 2, 2, 2])
+    col1, col2 = st.columns([1, 8])
     
     with col1:
         st.markdown("<h4 style='text-align: center;'>⚔️</h4>", unsafe_allow_html=True)
     with col2:
-        button_type = "primary" if current_page == "Home" else "secondary"
-        if st.button("🏠 Home", use_container_width=True, type=button_type):
-            st.switch_page("streamlit_app.py")
-    
-    with col3:
-        button_type = "primary" if current_page == "Single Game" else "secondary"
-        if st.button("📊 Single Game", use_container_width=True, type=button_type):
-            st.switch_page("pages/1_📊_Single_Game.py")
-    
-    with col4:
-        button_type = "primary" if current_page == "Global Stats" else "secondary"
-        if st.button("🌌 Global Stats", use_container_width=True, type=button_type):
-            st.switch_page("pages/2_🌌_Global_Stats.py")
-    
-    with col5:
-        button_type = "primary" if current_page == "Marmotte Flip" else "secondary"
-        if st.button("🦦 Marmotte Flip", use_container_width=True, type=button_type):
-            st.switch_page("pages/3_🦦_Marmotte_Flip.py")
-    
+        # One radio widget instead of a button per page
+        selected_page = st.radio(
+            "Navigation",
+            _PAGE_NAMES,
+            index=_PAGE_NAMES.index(current_page) if current_page in NAVIGATION_PAGES else None,
+            format_func=lambda page: NAVIGATION_PAGES[page][0],
+            horizontal=True,
+            label_visibility="collapsed"
+        )
     
+    if selected_page is not None and selected_page != current_page:
+        st.switch_page(NAVIGATION_PAGES[selected_page][1])
     
     st.markdown("---")
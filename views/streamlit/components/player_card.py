@@ -3,9 +3,52 @@
 Reusable player card component for displaying player information
 """
 
+from contextlib import contextmanager
+from html import escape
+import pandas as pd
 import streamlit as st
 from utils.utils import fix_encoding, normalize_player_name, get_position_display_name
-from constants import PAGES, WIN_EMOJI, LOSE_EMOJI
+from utils.predicates import DataFrameStyler
+from constants import PAGES, WIN_EMOJI, LOSE_EMOJI, WIN_RATE_COL
+
+# From this many search results on, players are listed in one selectable table instead of cards
+PLAYER_TABLE_MIN_RESULTS = 6
+
+# Card text styles, sent once per grid so each card is a single small markdown element
+_CARD_STYLES = """<style>
+.player-card h5 { padding: 0 0 0.25rem 0; }
+.player-card p { margin: 0; }
+.player-card .card-caption { font-size: 0.875rem; opacity: 0.6; }
+</style>"""
+# Session state flag, set while a grid has already sent the card styles for its cards
+_CARD_STYLES_SENT = 'player_card_styles_sent'
+
+
+def _display_card_styles():
+    """Emit the player card styles before a card, unless the enclosing grid already sent them"""
+    if not st.session_state.get(_CARD_STYLES_SENT):
+        st.markdown(_CARD_STYLES, unsafe_allow_html=True)
+
+
+@contextmanager
+def _shared_card_styles():
+    """Send the card styles once for every card drawn inside the block"""
+    _display_card_styles()
+    st.session_state[_CARD_STYLES_SENT] = True
+    try:
+        yield
+    finally:
+        # Cleared on the way out, so the next run sends the styles again
+        st.session_state[_CARD_STYLES_SENT] = False
+
+
+def _card_html(display_name: str, extra_title: str, details: str, caption: bool) -> str:
+    """Title and details line of a card as one HTML block, with the text escaped"""
+    details_class = ' class="card-caption"' if caption else ''
+    return (
+        f'<div class="player-card"><h5>{escape(display_name)} - <i>{escape(extra_title)}</i></h5>'
+        f'<p{details_class}>{escape(details)}</p></div>'
+    )
 
 
 def display_player_card(player_name: str, player_stats=None, participant=None, show_profile_button: bool = True):
@@ -28,44 +71,104 @@ def display_player_card(player_name: str, player_stats=None, participant=None, s
     # Use normalized player name for display
     display_name = normalize_player_name(player_name)
     
+    _display_card_styles()
     with st.container(border=True):
-        st.markdown(f"##### {display_name} - *{extra_title}*")
         if participant:
-            st.write(f"{games_text} • {WIN_EMOJI if participant.get_win() else LOSE_EMOJI} • {extra_info}")
+            details = f"{games_text} • {WIN_EMOJI if participant.get_win() else LOSE_EMOJI} • {extra_info}"
         else:
-            st.caption(f"{games_text} • {extra_info}")
+            details = f"{games_text} • {extra_info}"
+        st.markdown(_card_html(display_name, extra_title, details, caption=not participant), unsafe_allow_html=True)
         
         if show_profile_button:
-            if st.button("View Profile", key=f"profile_{player_name}", use_container_width=True):
-                st.session_state.selected_player = normalize_player_name(player_name)
-                st.switch_page(PAGES['PLAYER_PROFILE'])
-                profile_clicked = True
+            profile_clicked = _display_profile_button(player_name, display_name)
     
     return profile_clicked
 
 
+def _display_profile_button(player_name: str, display_name: str) -> bool:
+    """Show the View Profile button of a card and open the player profile when clicked"""
+    if st.button("View Profile", key=f"profile_{player_name}", use_container_width=True):
+        st.session_state.selected_player = display_name
+        st.switch_page(PAGES['PLAYER_PROFILE'])
+        return True
+    return False
+
+
+def _participant_card_fields(participant) -> dict:
+    """Display strings of a participant card, read from the participant once"""
+    player_name = participant.get_name()
+    return {
+        'player_name': player_name,
+        'display_name': normalize_player_name(player_name),
+        'champion': participant.get_champion(),
+        'position': get_position_display_name(participant.get_position(), short=True),
+        'result': WIN_EMOJI if participant.get_win() else LOSE_EMOJI,
+        'kda': f"{participant.get_kills()}/{participant.get_deaths()}/{participant.get_assists()}"
+    }
+
+
+def _display_participant_card(card: dict, show_profile_button: bool) -> bool:
+    """Display a participant card from its precomputed display strings"""
+    with st.container(border=True):
+        details = f"{card['position']} • {card['result']} • {card['kda']}"
+        st.markdown(_card_html(card['display_name'], card['champion'], details, caption=False), unsafe_allow_html=True)
+        
+        if show_profile_button:
+            return _display_profile_button(card['player_name'], card['display_name'])
+    return False
+
+
 def display_player_cards_grid(matching_players: list, analyzer, cols_per_row: int = 3, show_profile_buttons: bool = True):
     """Display a grid of player cards using multi-game stats"""
-    for i in range(0, len(matching_players), cols_per_row):
-        cols = st.columns(cols_per_row)
-        
-        for j, player_name in enumerate(matching_players[i:i+cols_per_row]):
-            with cols[j]:
-                # Get basic player info
-                player_stats = analyzer.player_stats.get(player_name)
-                if player_stats:
-                    display_player_card(player_name, player_stats=player_stats, show_profile_button=show_profile_buttons)
+    # Players without stats are dropped first so they do not leave empty slots in the grid
+    player_stats_by_name = analyzer.player_stats
+    cards = [
+        (player_name, player_stats_by_name[player_name])
+        for player_name in matching_players if player_stats_by_name.get(player_name)
+    ]
+    
+    with _shared_card_styles():
+        # Columns of every row, created in one pass
+        rows = [st.columns(cols_per_row) for _ in range(0, len(cards), cols_per_row)]
+        for index, (player_name, player_stats) in enumerate(cards):
+            with rows[index // cols_per_row][index % cols_per_row]:
+                display_player_card(player_name, player_stats=player_stats, show_profile_button=show_profile_buttons)
+
+
+def display_player_table(matching_players: list, analyzer):
+    """Display players with multi-game stats as one selectable table (selecting a row opens the profile)"""
+    player_stats_by_name = analyzer.player_stats
+    rows = [
+        (normalize_player_name(player_name), player_stats.get_most_played_position(),
+         player_stats.games_played, player_stats.get_win_rate())
+        for player_name in matching_players
+        if (player_stats := player_stats_by_name.get(player_name))
+    ]
+    players_df = pd.DataFrame(rows, columns=['Player', 'Position', 'Games', WIN_RATE_COL])
+    
+    event = st.dataframe(
+        players_df,
+        hide_index=True,
+        use_container_width=True,
+        column_config=DataFrameStyler.get_win_rate_column_config(),
+        on_select="rerun",
+        selection_mode="single-row"
+    )
+    if event.selection.rows:
+        st.session_state.selected_player = players_df['Player'].iat[event.selection.rows[0]]
+        st.switch_page(PAGES['PLAYER_PROFILE'])
 
 
 def display_participants_cards_grid(participants: list, cols_per_row: int = 5, show_profile_buttons: bool = False):
     """Display a grid of participant cards using single game data"""
-    for i in range(0, len(participants), cols_per_row):
+    cards = [_participant_card_fields(participant) for participant in participants]
+    _display_card_styles()
+    for i in range(0, len(cards), cols_per_row):
         cols = st.columns(cols_per_row)
         
-        for j, participant in enumerate(participants[i:i+cols_per_row]):
+        for j, card in enumerate(cards[i:i+cols_per_row]):
             with cols[j]:
-                player_name = participant.get_name()
-                display_player_card(player_name, participant=participant, show_profile_button=show_profile_buttons)
+                _display_participant_card(card, show_profile_buttons)
 
 
 def display_player_search_results(search_term: str, analyzer):
@@ -81,6 +184,9 @@ def display_player_search_results(search_term: str, analyzer):
     
     if matching_players:
         st.caption(f"Found {len(matching_players)} matching player(s)")
-        display_player_cards_grid(matching_players, analyzer)
+        if len(matching_players) >= PLAYER_TABLE_MIN_RESULTS:
+            display_player_table(matching_players, analyzer)
+        else:
+            display_player_cards_grid(matching_players, analyzer)
     else:
         st.warning(f"No players found matching '{search_term}'")
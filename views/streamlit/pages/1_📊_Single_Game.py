@@ -13,7 +13,6 @@ import pandas as pd
 
 # Import models and utilities
 from models.game_data import GameData
-from views.shared.game_vizualizer import GameVisualizer
 from views.streamlit.components.navigation import create_navigation
 from views.streamlit.components.player_card import display_participants_cards_grid
 from utils.utils import fix_encoding, normalize_player_name, get_position_display_name
@@ -30,8 +29,9 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_data(ttl="60s", show_spinner=False)
 def get_available_games():
-    """Get list of available game files"""
+    """Get list of available game files (directory scanned at most once a minute, see the sidebar refresh button)"""
     data_dir = "data"
     if not os.path.exists(data_dir):
         return []
@@ -325,6 +325,8 @@ def main():
     selected_game_path = st.session_state.get('selected_game', None)
     
     # Game file selection
+    if st.sidebar.button("🔄 Refresh file list", help="Scan the data directory again for new game files"):
+        get_available_games.clear()
     available_games = get_available_games()
     
     if not available_games:
@@ -334,9 +336,10 @@ def main():
     # If a game was selected from home page, find its filename
     if selected_game_path:
         selected_filename = os.path.basename(selected_game_path)
-        if selected_filename in available_games:
-            default_index = available_games.index(selected_filename)
-        else:
+        # One pass over the listing instead of a membership scan followed by an index scan
+        game_indices = {filename: index for index, filename in enumerate(available_games)}
+        default_index = game_indices.get(selected_filename)
+        if default_index is None:
             default_index = 0
             st.warning(f"Selected game {selected_filename} not found, using first available game")
     else:
@@ -16,7 +16,6 @@ from models.team_analyzer import TeamAnalyzer
 from models.team_service import TeamService
 from constants import UNKNOWN_VALUE, POSITIONS
 from models.position_comparison import PositionComparison
-from views.shared.team_visualizer import TeamVisualizer
 from utils.utils import fix_encoding, get_position_display_name, normalize_player_name
 from views.streamlit.components.navigation import create_navigation
 
@@ -39,13 +38,11 @@ def load_team_analyzer():
             st.session_state.team_analyzer = analyzer
             st.session_state.team_service = TeamService(analyzer)
             st.session_state.position_comparison = PositionComparison(analyzer, None)
-            st.session_state.team_visualizer = TeamVisualizer(analyzer)
             st.success("✅ Team analysis loaded successfully")
     
     return (st.session_state.team_analyzer, 
             st.session_state.team_service,
-            st.session_state.position_comparison, 
-            st.session_state.team_visualizer)
+            st.session_state.position_comparison)
 
 def display_team_overview(team_service: TeamService):
     """Display team overview and summary statistics"""
@@ -72,27 +69,27 @@ def display_team_overview(team_service: TeamService):
     with col4:
         st.metric("Total Performances", team_stats.get('total_performances', 0))
 
-def display_player_detailed_analysis(team_service: TeamService, analyzer):
-    """Display detailed player analysis using team service"""
-    st.subheader("👤 Player Detailed Analysis")
+def _select_team_player(team_service: TeamService, label: str):
+    """Show the team player selectbox and return (original_name, position) of the selection"""
+    # Display name -> (original name, position), built once by the service
+    options_by_display = team_service.get_player_options_by_display()
     
-    # Get player options from service
-    player_options = team_service.get_player_options_for_ui()
-    
-    if not player_options:
+    if not options_by_display:
         st.warning("No team players found")
-        return
+        return None
     
-    # Player selection using formatted options
-    display_options = [display_name for display_name, _, _ in player_options]
-    selected_option = st.selectbox("Select a player to analyze:", display_options)
+    selected_option = st.selectbox(label, options_by_display)
+    
+    return options_by_display.get(selected_option)
+
+def display_player_detailed_analysis(team_service: TeamService, analyzer):
+    """Display detailed player analysis using team service"""
+    st.subheader("👤 Player Detailed Analysis")
     
-    if selected_option:
-        # Find the selected player data
-        for display_name, position, original_name in player_options:
-            if display_name == selected_option:
-                display_individual_player_stats(analyzer, original_name, position, team_service)
-                break
+    selection = _select_team_player(team_service, "Select a player to analyze:")
+    if selection:
+        original_name, position = selection
+        display_individual_player_stats(analyzer, original_name, position, team_service)
 
 def display_individual_player_stats(analyzer, player_name, position, team_service: TeamService):
     """Display stats for an individual player"""
@@ -134,23 +131,10 @@ def display_position_comparison(team_service: TeamService, analyzer):
     """Display position comparison analysis using team service"""
     st.subheader("⚖️ Position Comparison")
     
-    # Get player options from service
-    player_options = team_service.get_player_options_for_ui()
-    
-    if not player_options:
-        st.warning("No team players found")
-        return
-    
-    # Player selection using formatted options
-    display_options = [display_name for display_name, _, _ in player_options]
-    selected_option = st.selectbox("Select a player to compare:", display_options)
-    
-    if selected_option:
-        # Find the selected player data
-        for display_name, position, original_name in player_options:
-            if display_name == selected_option:
-                _display_player_comparison(analyzer, original_name, position, team_service)
-                break
+    selection = _select_team_player(team_service, "Select a player to compare:")
+    if selection:
+        original_name, position = selection
+        _display_player_comparison(analyzer, original_name, position, team_service)
 
 def _display_player_comparison(analyzer, player_name, position, team_service: TeamService):
     """Display comparison for a specific player"""
@@ -276,6 +260,14 @@ def create_position_radar_chart(metrics, our_values, opponent_values, position,
     
     st.plotly_chart(fig, use_container_width=True)
 
+# (tab label, section renderer taking (team_service, analyzer)), in tab order
+TEAM_SECTIONS = (
+    ("🏆 Team Overview", lambda team_service, analyzer: display_team_overview(team_service)),
+    ("👤 Player Analysis", display_player_detailed_analysis),
+    ("⚖️ Position Comparison", display_position_comparison),
+)
+TAB_LABELS = tuple(label for label, _ in TEAM_SECTIONS)
+
 def main():
     """Main team analysis page"""
     create_navigation("Marmotte Flip")
@@ -285,23 +277,12 @@ def main():
     
     try:
         # Load analyzers and service
-        analyzer, team_service, _, _ = load_team_analyzer()
-        
-        # Main sections
-        tab1, tab2, tab3 = st.tabs([
-            "🏆 Team Overview", 
-            "👤 Player Analysis", 
-            "⚖️ Position Comparison", 
-        ])
-        
-        with tab1:
-            display_team_overview(team_service)
-        
-        with tab2:
-            display_player_detailed_analysis(team_service, analyzer)
+        analyzer, team_service, _ = load_team_analyzer()
         
-        with tab3:
-            display_position_comparison(team_service, analyzer)
+        # Main sections, each tab paired by index with its section renderer
+        for tab, (_, display_section) in zip(st.tabs(TAB_LABELS), TEAM_SECTIONS):
+            with tab:
+                display_section(team_service, analyzer)
             
     except Exception as e:
         st.error(f"❌ Error in team analysis: {str(e)}")
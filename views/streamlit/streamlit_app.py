@@ -15,24 +15,12 @@ if project_root not in sys.path:
 
 # Import the main application components
 from config import STREAMLIT_CONFIG, APP_VERSION, APP_DESCRIPTION
-from models.multi_game_analyzer import MultiGameAnalyzer
 from utils.utils import fix_encoding, normalize_player_name
-from constants import DATA_DIR
-from views.streamlit.components import display_player_search_results, display_game_cards_grid, create_navigation
+from views.streamlit.components import display_player_search_results, display_game_cards_grid, create_navigation, load_multi_game_analyzer, load_games_data
 
 # Configure Streamlit page
 st.set_page_config(**STREAMLIT_CONFIG)
 
-def load_multi_game_analyzer():
-    """Load and cache the multi-game analyzer"""
-    if 'multi_game_analyzer' not in st.session_state:
-        with st.spinner("Loading and analyzing all games..."):
-            analyzer = MultiGameAnalyzer(DATA_DIR)
-            analyzer.load_all_games()
-            st.session_state.multi_game_analyzer = analyzer
-    
-    return st.session_state.multi_game_analyzer
-
 def display_player_search():
     """Display player search functionality on home page"""
     st.subheader("🔍 Player Search")
@@ -58,8 +46,8 @@ def display_games():
         # Load analyzer
         analyzer = load_multi_game_analyzer()
         
-        # Get all games data
-        games_data = analyzer.get_all_games_data()
+        # Get all games data (cached until a game file changes)
+        games_data = load_games_data()
         
         if not games_data:
             st.warning("No games found in the data directory")